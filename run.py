@@ -13,6 +13,8 @@ Usage:
 
 import sys
 import argparse
+import asyncio
+import signal
 from pathlib import Path
 from datetime import datetime
 import time
@@ -22,12 +24,9 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from src.utils.config_loader import ConfigLoader
 from src.utils.logger import setup_logger
-from src.main import ActivityReporter
 
-# APScheduler imports
-from apscheduler.schedulers.blocking import BlockingScheduler
-from apscheduler.triggers.cron import CronTrigger
-from apscheduler.triggers.interval import IntervalTrigger
+# The reporting pipeline (pandas, openpyxl, reportlab) and APScheduler are
+# imported where they are used so `--help` and one-shot runs start faster
 
 logger = setup_logger(__name__)
 
@@ -53,8 +52,14 @@ class ReportScheduler:
         Args:
             config: ConfigLoader instance with system configuration
         """
+        from apscheduler.schedulers.asyncio import AsyncIOScheduler
+        from src.main import ActivityReporter
+
         self.config = config
-        self.scheduler = BlockingScheduler()
+        self.scheduler = AsyncIOScheduler()
+
+        # Built once and reused by every trigger, so the parsed configuration
+        # and initialized notifiers are never rebuilt per job
         self.reporter = ActivityReporter(config)
 
     def job_function(self):
@@ -67,6 +72,9 @@ class ReportScheduler:
 
     def setup_schedule(self):
         """Set up the schedule based on configuration."""
+        from apscheduler.triggers.cron import CronTrigger
+        from apscheduler.triggers.interval import IntervalTrigger
+
         schedule_type = self.config.get('schedule.type', 'interval')
 
         if schedule_type == 'cron':
@@ -152,10 +160,38 @@ class ReportScheduler:
         logger.info("Scheduler started. Press Ctrl+C to exit.")
 
         try:
-            self.scheduler.start()
+            asyncio.run(self._run_until_stopped())
         except (KeyboardInterrupt, SystemExit):
-            logger.info("Scheduler stopped by user")
+            pass
+
+        logger.info("Scheduler stopped by user")
+
+    async def _run_until_stopped(self):
+        """
+        Run the scheduler on the event loop until a stop signal arrives.
+
+        The loop sleeps until the next fire time instead of polling, and
+        SIGINT/SIGTERM set an event that triggers a clean shutdown.
+        """
+        stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop_event.set)
+            except (NotImplementedError, RuntimeError):
+                # Signal handlers are unavailable on Windows event loops;
+                # Ctrl+C still surfaces as KeyboardInterrupt there
+                pass
+
+        self.scheduler.start()
+
+        try:
+            await stop_event.wait()
+        finally:
             self.scheduler.shutdown()
+            # Let the scheduler's deferred shutdown callback run
+            await asyncio.sleep(0)
 
 
 def main():
@@ -169,6 +205,7 @@ Examples:
   python run.py --schedule         # Run with scheduler
   python run.py --schedule --now   # Run immediately then schedule
   python run.py --config custom.yaml  # Use custom config file
+  python run.py --cache-config     # Reuse the parsed config between runs
         """
     )
 
@@ -190,6 +227,13 @@ Examples:
         help='Path to configuration file (default: config/config.yaml)'
     )
 
+    parser.add_argument(
+        '--cache-config',
+        action='store_true',
+        help='Cache the parsed configuration next to the config file '
+             '(<config>.cache.json) and reuse it while the file is unchanged'
+    )
+
     args = parser.parse_args()
 
     # Set up logging
@@ -212,7 +256,7 @@ Examples:
         sys.exit(1)
 
     try:
-        config = ConfigLoader(str(config_path))
+        config = ConfigLoader(str(config_path), disk_cache=args.cache_config)
 
         if args.schedule:
             # Scheduled mode
@@ -220,6 +264,8 @@ Examples:
             scheduler.start(run_now=args.now)
         else:
             # One-time execution
+            from src.main import ActivityReporter
+
             logger.info("Running in one-time execution mode")
             reporter = ActivityReporter(config)
             success = reporter.run()
@@ -6,12 +6,22 @@ Calculates totals, averages, trends, counts, and other statistics.
 
 import pandas as pd
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 from ..utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Aggregations that pandas can run with the Numba engine
+NUMBA_FUNCTIONS = {'sum', 'mean', 'min', 'max', 'std', 'var'}
+NUMBA_ENGINE_KWARGS = {'nopython': True, 'nogil': True}
+
+WEEKDAY_NAMES = [
+    'Monday', 'Tuesday', 'Wednesday', 'Thursday',
+    'Friday', 'Saturday', 'Sunday'
+]
+
 
 class DataSummarizer:
     """
@@ -53,6 +63,12 @@ class DataSummarizer:
             - metrics: Dictionary of metric columns and aggregation functions
             - include_trends: Calculate week-over-week trends (default: True)
             - include_percentages: Calculate percentage breakdowns (default: True)
+            - use_pyarrow: Convert columns to PyArrow-backed dtypes before
+              grouping; requires pyarrow (default: False)
+            - use_numba: Run sum/mean/min/max/std/var aggregations with the
+              Numba engine; requires numba (default: False)
+            - parallel_summaries: Compute independent summaries in a thread
+              pool (default: False)
         """
         if config is None:
             config = {}
@@ -64,67 +80,184 @@ class DataSummarizer:
         if date_column not in df.columns:
             raise ValueError(f"Date column '{date_column}' not found in DataFrame")
 
+        # Nothing to aggregate; skip building time dimensions and groupers
+        # but return the same keys a non-empty input would produce
+        if df.empty:
+            logger.info("No rows to summarize, returning empty summaries")
+            summaries = {'weekly_totals': pd.DataFrame()}
+
+            if 'group_by' in config:
+                summaries['by_category'] = pd.DataFrame()
+            if config.get('include_trends', True):
+                summaries['trends'] = pd.DataFrame()
+
+            summaries['daily_breakdown'] = pd.DataFrame()
+            summaries['statistics'] = pd.DataFrame()
+
+            if 'group_by' in config:
+                # Cheap on no rows, and yields the same per-item keys
+                summaries['top_items'] = self._calculate_top_items(df, config)
+
+            self.summary_results = summaries
+            return summaries
+
         # Ensure date column is datetime
         if not pd.api.types.is_datetime64_any_dtype(df[date_column]):
-            df[date_column] = pd.to_datetime(df[date_column])
+            df = df.assign(**{date_column: pd.to_datetime(df[date_column])})
+
+        # Optionally move to Arrow-backed dtypes for faster grouping on strings
+        if config.get('use_pyarrow', False):
+            df = self._to_arrow_dtypes(df, date_column)
 
         # Add week-related columns
         df = self._add_time_dimensions(df, date_column)
 
-        # Initialize results dictionary
-        summaries = {}
-
-        # Overall weekly summary
-        summaries['weekly_totals'] = self._calculate_weekly_totals(df, config)
+        # Low-cardinality group columns hash much faster as categoricals
+        if 'group_by' in config:
+            df = self._categorize_columns(df, self._get_group_columns(config))
 
-        # Group-based summaries
+        # Build the groupers once and share them across sub-summaries so
+        # group keys are only hashed a single time
+        week_grouper = df.groupby('week_start', sort=False, observed=True)
+        group_grouper = None
         if 'group_by' in config:
-            summaries['by_category'] = self._calculate_group_summaries(df, config)
+            group_grouper = df.groupby(
+                ['week_start'] + self._get_group_columns(config),
+                sort=False,
+                observed=True
+            )
+
+        # The sub-summaries only read df, so they can run concurrently;
+        # pandas releases the GIL inside its C aggregation loops
+        tasks = {
+            'weekly_totals': (self._calculate_weekly_totals, (df, config, week_grouper))
+        }
+        if group_grouper is not None:
+            tasks['by_category'] = (
+                self._calculate_group_summaries, (df, config, group_grouper)
+            )
+        tasks['daily_breakdown'] = (self._calculate_daily_breakdown, (df, config))
+        tasks['statistics'] = (self._calculate_statistics, (df, config))
+        if 'group_by' in config:
+            tasks['top_items'] = (self._calculate_top_items, (df, config))
+
+        if config.get('parallel_summaries', False):
+            with ThreadPoolExecutor(max_workers=min(4, len(tasks))) as executor:
+                futures = {
+                    name: executor.submit(func, *args)
+                    for name, (func, args) in tasks.items()
+                }
+                results = {name: future.result() for name, future in futures.items()}
+        else:
+            results = {name: func(*args) for name, (func, args) in tasks.items()}
 
-        # Trend analysis
-        if config.get('include_trends', True):
-            summaries['trends'] = self._calculate_trends(summaries['weekly_totals'])
+        # Assemble in a fixed order so report sheets and sections stay stable
+        summaries = {'weekly_totals': results['weekly_totals']}
 
-        # Daily breakdown
-        summaries['daily_breakdown'] = self._calculate_daily_breakdown(df, config)
+        if 'by_category' in results:
+            summaries['by_category'] = results['by_category']
 
-        # Statistics summary
-        summaries['statistics'] = self._calculate_statistics(df, config)
+        # Trend analysis depends on weekly totals (needs at least two weeks;
+        # with fewer the key is kept with an empty frame)
+        if config.get('include_trends', True):
+            if len(summaries['weekly_totals']) >= 2:
+                summaries['trends'] = self._calculate_trends(summaries['weekly_totals'])
+            else:
+                summaries['trends'] = pd.DataFrame()
 
-        # Top performers/items
-        if 'group_by' in config:
-            summaries['top_items'] = self._calculate_top_items(df, config)
+        summaries['daily_breakdown'] = results['daily_breakdown']
+        summaries['statistics'] = results['statistics']
+
+        if 'top_items' in results:
+            summaries['top_items'] = results['top_items']
 
         logger.info(f"Weekly summarization completed. Generated {len(summaries)} summary reports")
 
         self.summary_results = summaries
         return summaries
 
+    def _to_arrow_dtypes(
+        self,
+        df: pd.DataFrame,
+        date_column: str
+    ) -> pd.DataFrame:
+        """Convert non-date columns to PyArrow-backed dtypes if available."""
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            logger.warning("use_pyarrow is enabled but pyarrow is not installed")
+            return df
+
+        # The date column stays datetime64 since time dimensions rely on
+        # accessors that Arrow timestamps don't provide
+        converted = df.drop(columns=[date_column]).convert_dtypes(
+            convert_integer=False,
+            dtype_backend='pyarrow'
+        )
+
+        return df.assign(**{col: converted[col] for col in converted.columns})
+
     def _add_time_dimensions(
         self,
         df: pd.DataFrame,
         date_column: str
     ) -> pd.DataFrame:
         """Add week, month, and other time-based columns."""
-        df['year'] = df[date_column].dt.year
-        df['month'] = df[date_column].dt.month
-        df['week'] = df[date_column].dt.isocalendar().week
-        df['day_of_week'] = df[date_column].dt.day_name()
-        df['week_start'] = df[date_column].dt.to_period('W').dt.start_time
+        dates = df[date_column].dt
+
+        # Single assign returns a new frame and leaves the caller's untouched
+        return df.assign(
+            year=dates.year.astype('Int16'),
+            month=dates.month.astype('Int8'),
+            week=dates.isocalendar().week.astype('Int8'),
+            day_of_week=pd.Categorical(
+                dates.day_name(), categories=WEEKDAY_NAMES, ordered=True
+            ),
+            # Monday of each week, computed directly rather than via Periods
+            week_start=dates.normalize() - pd.to_timedelta(dates.weekday, unit='D')
+        )
+
+    def _categorize_columns(
+        self,
+        df: pd.DataFrame,
+        columns: List[str],
+        max_unique_ratio: float = 0.5
+    ) -> pd.DataFrame:
+        """Convert low-cardinality columns to categorical dtype."""
+        if df.empty:
+            return df
+
+        converted = {}
+        for col in columns:
+            if col not in df.columns or isinstance(df[col].dtype, pd.CategoricalDtype):
+                continue
+            if df[col].nunique() / len(df) < max_unique_ratio:
+                converted[col] = df[col].astype('category')
+
+        return df.assign(**converted) if converted else df
 
-        return df
+    def _get_group_columns(self, config: Dict[str, Any]) -> List[str]:
+        """Return the configured group_by columns as a list."""
+        group_by = config['group_by']
+        if isinstance(group_by, str):
+            group_by = [group_by]
+        return list(group_by)
 
     def _calculate_weekly_totals(
         self,
         df: pd.DataFrame,
-        config: Dict[str, Any]
+        config: Dict[str, Any],
+        grouper=None
     ) -> pd.DataFrame:
         """Calculate overall weekly totals."""
         metrics = config.get('metrics', {})
 
+        if grouper is None:
+            grouper = df.groupby('week_start', sort=False, observed=True)
+
         if not metrics:
             # Default: count rows per week
-            weekly = df.groupby('week_start').size().reset_index(name='count')
+            weekly = grouper.size().reset_index(name='count')
         else:
             # Apply configured aggregations
             agg_dict = {}
@@ -135,38 +268,93 @@ class DataSummarizer:
                     elif isinstance(functions, list):
                         agg_dict[column] = functions
 
-            weekly = df.groupby('week_start').agg(agg_dict).reset_index()
+            weekly = self._aggregate(df, grouper, agg_dict, config).reset_index()
 
-            # Flatten multi-level columns if multiple aggregations
-            if isinstance(weekly.columns, pd.MultiIndex):
-                weekly.columns = ['_'.join(col).strip('_') for col in weekly.columns.values]
+        # Groupers are unsorted; order chronologically for trend calculations
+        weekly = weekly.sort_values('week_start', ignore_index=True)
 
         # Add week number and year
-        weekly['week_number'] = weekly['week_start'].dt.isocalendar().week
-        weekly['year'] = weekly['week_start'].dt.year
+        week_dates = weekly['week_start'].dt
+        weekly = weekly.assign(
+            week_number=week_dates.isocalendar().week,
+            year=week_dates.year
+        )
 
         logger.info(f"Calculated weekly totals for {len(weekly)} weeks")
 
         return weekly
 
-    def _calculate_group_summaries(
+    def _aggregate(
         self,
         df: pd.DataFrame,
+        grouper,
+        agg_dict: Dict[str, Any],
         config: Dict[str, Any]
+    ) -> pd.DataFrame:
+        """
+        Apply configured aggregations to a grouper built from df.
+
+        Returns flat result columns: ``<column>_<func>`` as soon as any
+        metric lists several functions, otherwise the plain column name.
+        Uses the Numba engine when enabled and every function supports it.
+        """
+        # Named aggregation yields flat columns directly, with no MultiIndex
+        # to build and flatten afterwards
+        multi_level = any(isinstance(funcs, list) for funcs in agg_dict.values())
+        named = {
+            (f'{column}_{func}' if multi_level else column): (column, func)
+            for column, funcs in agg_dict.items()
+            for func in (funcs if isinstance(funcs, list) else [funcs])
+        }
+
+        if not named:
+            raise ValueError("None of the configured metric columns were found")
+
+        functions = {func for _, func in named.values()}
+
+        if not (config.get('use_numba', False) and functions <= NUMBA_FUNCTIONS):
+            return grouper.agg(**named)
+
+        try:
+            import numba  # noqa: F401
+        except ImportError:
+            logger.warning("use_numba is enabled but numba is not installed")
+            return grouper.agg(**named)
+
+        # The Numba kernels divide by the per-group count of valid values,
+        # which fails for groups that only contain missing values
+        if df[list(agg_dict)].isna().to_numpy().any():
+            return grouper.agg(**named)
+
+        results = {
+            name: getattr(grouper[column], func)(
+                engine='numba', engine_kwargs=NUMBA_ENGINE_KWARGS
+            )
+            for name, (column, func) in named.items()
+        }
+
+        return pd.DataFrame(results)
+
+    def _calculate_group_summaries(
+        self,
+        df: pd.DataFrame,
+        config: Dict[str, Any],
+        grouper=None
     ) -> pd.DataFrame:
         """Calculate summaries grouped by categories."""
-        group_by = config['group_by']
-        if isinstance(group_by, str):
-            group_by = [group_by]
+        group_by = self._get_group_columns(config)
 
         # Add week_start to grouping
         group_columns = ['week_start'] + group_by
 
+        if grouper is None:
+            grouper = df.groupby(group_columns, sort=False, observed=True)
+
         metrics = config.get('metrics', {})
 
         if not metrics:
             # Default: count by group
-            summary = df.groupby(group_columns).size().reset_index(name='count')
+            summary = grouper.size().reset_index(name='count')
         else:
             # Apply configured aggregations
             agg_dict = {}
@@ -174,21 +362,33 @@ class DataSummarizer:
                 if column in df.columns:
                     agg_dict[column] = functions
 
-            summary = df.groupby(group_columns).agg(agg_dict).reset_index()
+            summary = self._aggregate(df, grouper, agg_dict, config).reset_index()
 
-            # Flatten multi-level columns if multiple aggregations
-            if isinstance(summary.columns, pd.MultiIndex):
-                summary.columns = ['_'.join(str(c) for c in col).strip('_') if col[1] else col[0]
-                                  for col in summary.columns.values]
+        summary = summary.sort_values(group_columns, ignore_index=True)
 
         # Add percentages if requested
         if config.get('include_percentages', True):
             # Calculate percentage within each week
-            numeric_cols = [col for col in summary.columns
-                          if col not in group_columns and pd.api.types.is_numeric_dtype(summary[col])]
-            for col in numeric_cols:
-                total_by_week = summary.groupby('week_start')[col].transform('sum')
-                summary[f'{col}_percentage'] = (summary[col] / total_by_week * 100).round(2)
+            numeric_cols = summary.select_dtypes(include=[np.number]).columns.drop(
+                group_columns, errors='ignore'
+            ).tolist()
+            if numeric_cols:
+                # One transform for all metrics instead of one per column
+                totals_by_week = summary.groupby(
+                    'week_start', sort=False, observed=True
+                )[numeric_cols].transform('sum')
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    percentages = np.round(
+                        summary[numeric_cols].to_numpy(dtype='float64')
+                        / totals_by_week.to_numpy(dtype='float64') * 100,
+                        2
+                    )
+                percentages = pd.DataFrame(
+                    percentages,
+                    columns=[f'{col}_percentage' for col in numeric_cols],
+                    index=summary.index
+                )
+                summary = pd.concat([summary, percentages], axis=1)
 
         logger.info(f"Calculated group summaries with {len(summary)} rows")
 
@@ -199,28 +399,37 @@ class DataSummarizer:
         weekly_df: pd.DataFrame
     ) -> pd.DataFrame:
         """Calculate week-over-week trends."""
-        trends = weekly_df.copy()
+        trends = weekly_df
 
         # Get numeric columns (excluding date/time columns)
         numeric_cols = trends.select_dtypes(include=[np.number]).columns
         numeric_cols = [col for col in numeric_cols
                        if col not in ['week_number', 'year']]
 
-        # Calculate week-over-week changes
-        for col in numeric_cols:
-            # Absolute change
-            trends[f'{col}_change'] = trends[col].diff()
+        # Calculate week-over-week changes for all metrics in one 2D pass
+        values = trends[numeric_cols].to_numpy(dtype='float64')
+        previous = np.empty_like(values)
+        previous[:1] = np.nan
+        previous[1:] = values[:-1]
 
-            # Percentage change
-            trends[f'{col}_pct_change'] = trends[col].pct_change() * 100
+        change = values - previous
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pct_change = change / previous * 100
 
         # Add trend direction indicators
-        for col in numeric_cols:
-            change_col = f'{col}_change'
-            if change_col in trends.columns:
-                trends[f'{col}_trend'] = trends[change_col].apply(
-                    lambda x: '↑' if x > 0 else ('↓' if x < 0 else '→')
-                )
+        directions = np.select([change > 0, change < 0], ['↑', '↓'], default='→')
+
+        new_columns = {}
+        for idx, col in enumerate(numeric_cols):
+            new_columns[f'{col}_change'] = change[:, idx]
+            new_columns[f'{col}_pct_change'] = pct_change[:, idx]
+        for idx, col in enumerate(numeric_cols):
+            new_columns[f'{col}_trend'] = directions[:, idx]
+
+        trends = pd.concat(
+            [trends, pd.DataFrame(new_columns, index=trends.index)],
+            axis=1
+        )
 
         logger.info(f"Calculated trends for {len(numeric_cols)} metrics")
 
@@ -236,7 +445,9 @@ class DataSummarizer:
         date_column = config.get('date_column', 'date')
 
         if not metrics:
-            daily = df.groupby([date_column, 'day_of_week']).size().reset_index(name='count')
+            daily = df.groupby(
+                [date_column, 'day_of_week'], sort=False, observed=True
+            ).size().reset_index(name='count')
         else:
             agg_dict = {}
             for column, functions in metrics.items():
@@ -246,10 +457,12 @@ class DataSummarizer:
                     elif isinstance(functions, list):
                         agg_dict[column] = functions[0]  # Use first function
 
-            daily = df.groupby([date_column, 'day_of_week']).agg(agg_dict).reset_index()
+            daily = df.groupby(
+                [date_column, 'day_of_week'], sort=False, observed=True
+            ).agg(agg_dict).reset_index()
 
         # Sort by date
-        daily = daily.sort_values(date_column)
+        daily = daily.sort_values(date_column, ignore_index=True)
 
         logger.info(f"Calculated daily breakdown for {len(daily)} days")
 
@@ -261,11 +474,10 @@ class DataSummarizer:
         config: Dict[str, Any]
     ) -> pd.DataFrame:
         """Calculate statistical summary (mean, median, std, min, max)."""
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
-
         # Exclude time-related columns
-        numeric_cols = [col for col in numeric_cols
-                       if col not in ['year', 'month', 'week']]
+        numeric_cols = df.select_dtypes(include=[np.number]).columns.drop(
+            ['year', 'month', 'week'], errors='ignore'
+        ).tolist()
 
         if not numeric_cols:
             return pd.DataFrame()
@@ -287,20 +499,27 @@ class DataSummarizer:
         top_n: int = 10
     ) -> Dict[str, pd.DataFrame]:
         """Calculate top N items by various metrics."""
-        group_by = config['group_by']
-        if isinstance(group_by, str):
-            group_by = [group_by]
+        group_by = self._get_group_columns(config)
 
         metrics = config.get('metrics', {})
         top_items = {}
 
-        for group_col in group_by:
-            if group_col not in df.columns:
-                continue
+        group_by = [col for col in group_by if col in df.columns]
+
+        if not metrics and group_by:
+            # Hash the data once; per-column counts are then marginals
+            # of the (much smaller) joint group sizes
+            joint_sizes = df.groupby(
+                group_by, sort=False, observed=True, dropna=False
+            ).size()
 
+        for group_col in group_by:
             if not metrics:
                 # Default: top by count
-                top = df[group_col].value_counts().head(top_n).reset_index()
+                counts = joint_sizes.groupby(
+                    level=group_col, sort=False, observed=True
+                ).sum()
+                top = counts.nlargest(top_n).reset_index()
                 top.columns = [group_col, 'count']
                 top_items[f'top_{group_col}'] = top
             else:
@@ -313,8 +532,9 @@ class DataSummarizer:
                         func = func[0]
 
                     if func in ['sum', 'mean', 'count']:
-                        grouped = df.groupby(group_col)[metric_col].agg(func).reset_index()
-                        grouped = grouped.sort_values(metric_col, ascending=False).head(top_n)
+                        grouped = df.groupby(
+                            group_col, sort=False, observed=True
+                        )[metric_col].agg(func).nlargest(top_n).reset_index()
                         top_items[f'top_{group_col}_by_{metric_col}'] = grouped
 
         logger.info(f"Calculated top items for {len(top_items)} categories")
@@ -346,10 +566,10 @@ class DataSummarizer:
             weekly = summaries['weekly_totals']
             if not weekly.empty:
                 lines.append("WEEKLY TOTALS:")
-                latest_week = weekly.iloc[-1]
-                for col in weekly.columns:
+                latest_week = weekly.tail(1).to_dict('records')[0]
+                for col, value in latest_week.items():
                     if col not in ['week_start', 'week_number', 'year']:
-                        lines.append(f"  Latest {col}: {latest_week[col]}")
+                        lines.append(f"  Latest {col}: {value}")
                 lines.append("")
 
         # Trends
@@ -357,7 +577,7 @@ class DataSummarizer:
             trends = summaries['trends']
             if not trends.empty:
                 lines.append("TRENDS (Latest Week):")
-                latest = trends.iloc[-1]
+                latest = trends.tail(1).to_dict('records')[0]
                 for col in trends.columns:
                     if col.endswith('_trend'):
                         base_col = col.replace('_trend', '')
@@ -375,11 +595,13 @@ class DataSummarizer:
             stats = summaries['statistics']
             if not stats.empty:
                 lines.append("STATISTICS:")
-                for idx, row in stats.iterrows():
+                for idx, mean, median, std in stats[['mean', 'median', 'std']].itertuples(
+                    index=True, name=None
+                ):
                     lines.append(
-                        f"  {idx}: mean={row['mean']:.2f}, "
-                        f"median={row['median']:.2f}, "
-                        f"std={row['std']:.2f}"
+                        f"  {idx}: mean={mean:.2f}, "
+                        f"median={median:.2f}, "
+                        f"std={std:.2f}"
                     )
                 lines.append("")
 
@@ -4,14 +4,137 @@ Data cleaning and validation for the activity reporting system.
 Provides comprehensive data cleaning, normalization, and validation.
 """
 
+import logging
+import operator
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Tuple, Union
 from datetime import datetime
 from ..utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Row filters supported by custom cleaning rules
+RULE_OPERATIONS: Dict[str, Callable[[pd.Series, Any], pd.Series]] = {
+    '>': operator.gt,
+    '<': operator.lt,
+    '>=': operator.ge,
+    '<=': operator.le,
+    '==': operator.eq,
+    '!=': operator.ne,
+    'in': lambda series, value: series.isin(value),
+    'not_in': lambda series, value: ~series.isin(value),
+}
+
+
+_NUMBA_IQR_MASK: Optional[Callable[[np.ndarray], np.ndarray]] = None
+
+
+def _iqr_mask(values: np.ndarray) -> np.ndarray:
+    """
+    Return the rows of a float64 block that lie within every column's IQR bounds.
+
+    Columns are taken in order and each column's quartiles come from the
+    rows that passed the previous columns, as with filtering the frame
+    column by column. Missing values fail the bounds check.
+    """
+    mask = np.ones(len(values), dtype=bool)
+
+    for j in range(values.shape[1]):
+        column = values[:, j]
+        survivors = column[mask]
+        survivors = survivors[~np.isnan(survivors)]
+        if survivors.size == 0:
+            # NaN bounds reject every row
+            mask[:] = False
+            break
+
+        q1, q3 = np.quantile(survivors, [0.25, 0.75])
+        iqr = q3 - q1
+        mask &= (column >= q1 - 1.5 * iqr) & (column <= q3 + 1.5 * iqr)
+
+    return mask
+
+
+def _get_numba_iqr_mask() -> Optional[Callable[[np.ndarray], np.ndarray]]:
+    """
+    Return the compiled counterpart of _iqr_mask, building it on first use.
+
+    Returns None when numba is not installed so callers can use the
+    NumPy mask instead.
+    """
+    global _NUMBA_IQR_MASK
+
+    if _NUMBA_IQR_MASK is None:
+        try:
+            from numba import njit, prange
+        except ImportError:
+            logger.warning("use_numba is enabled but numba is not installed")
+            return None
+
+        # cache=True keeps the compiled kernel on disk (__pycache__) so
+        # later runs skip compilation; fastmath is left off because it
+        # would let the compiler drop the NaN checks
+        @njit(parallel=True, cache=True)
+        def iqr_mask(values):
+            n_rows, n_cols = values.shape
+            mask = np.ones(n_rows, dtype=np.bool_)
+            for j in range(n_cols):
+                column = values[:, j]
+                survivors = column[mask]
+                survivors = survivors[~np.isnan(survivors)]
+                if survivors.size == 0:
+                    mask[:] = False
+                    break
+                q1 = np.quantile(survivors, 0.25)
+                q3 = np.quantile(survivors, 0.75)
+                lower = q1 - 1.5 * (q3 - q1)
+                upper = q3 + 1.5 * (q3 - q1)
+                for i in prange(n_rows):
+                    value = column[i]
+                    if mask[i] and not (value >= lower and value <= upper):
+                        mask[i] = False
+            return mask
+
+        _NUMBA_IQR_MASK = iqr_mask
+
+    return _NUMBA_IQR_MASK
+
+
+def _date_column_formats(
+    date_columns: Union[List[Any], Dict[str, Optional[str]]]
+) -> Dict[str, Optional[str]]:
+    """
+    Normalize the date_columns option to a column -> format mapping.
+
+    Accepts a list of column names, a list mixing names and
+    {column: format} mappings, or a single mapping.
+    """
+    if isinstance(date_columns, dict):
+        return dict(date_columns)
+
+    formats: Dict[str, Optional[str]] = {}
+    for entry in date_columns:
+        if isinstance(entry, dict):
+            formats.update(entry)
+        else:
+            formats[entry] = None
+
+    return formats
+
+
+def _string_columns(df: pd.DataFrame) -> List[str]:
+    """
+    Return the columns holding text.
+
+    Covers object columns as well as pandas and Arrow-backed string dtypes
+    (e.g. string[pyarrow] from the pyarrow CSV engine with arrow_dtypes).
+    """
+    return [
+        col for col, dtype in df.dtypes.items()
+        if pd.api.types.is_string_dtype(dtype)
+    ]
+
 
 class DataCleaner:
     """
@@ -51,13 +174,27 @@ class DataCleaner:
 
         Configuration options:
             - drop_duplicates: Remove duplicate rows (default: True)
+            - duplicate_subset: Columns that identify a duplicate row
+              (default: all columns)
             - drop_empty_rows: Remove rows with all NaN values (default: True)
             - fill_missing: Strategy for missing values ('drop', 'forward', 'mean', 'zero')
             - required_columns: List of column names that must exist
-            - date_columns: List of column names to parse as dates
+            - date_columns: List of column names to parse as dates; entries may
+              also be {column: format} mappings with a strftime format
             - numeric_columns: List of column names to convert to numeric
+            - downcast_numeric: Store converted numeric columns in the smallest
+              integer or float32 dtype that holds them (default: False)
             - remove_outliers: Remove outliers using IQR method (default: False)
             - standardize_strings: Trim and normalize string columns (default: True)
+            - use_numba: Build the outlier mask with a compiled Numba kernel;
+              requires numba (default: False)
+            - pushdown_rules: Apply custom rules whose columns no later step
+              changes right after empty-row removal, so conversions only see
+              surviving rows. Rules stay in place when duplicate_subset leaves
+              out their column, and none move with forward/backward/mean fills
+              or outlier removal, which depend on the other rows (default: False)
+            - engine: 'pandas' runs each step eagerly; 'polars' builds one lazy
+              query and collects it once; requires polars (default: 'pandas')
         """
         if config is None:
             config = {}
@@ -65,8 +202,9 @@ class DataCleaner:
         logger.info(f"Starting data cleaning. Input shape: {df.shape}")
         original_shape = df.shape
 
-        # Create a copy to avoid modifying original
-        df_clean = df.copy()
+        # Every step returns a new frame, so the caller's frame is never
+        # mutated and no upfront defensive copy is needed
+        df_clean = df
 
         # Reset statistics
         self.cleaning_stats = {
@@ -79,17 +217,58 @@ class DataCleaner:
         if 'required_columns' in config:
             df_clean = self._validate_columns(df_clean, config['required_columns'])
 
+        # The polars engine returns None when unavailable; fall back to pandas
+        df_lazy = None
+        if config.get('engine', 'pandas') == 'polars':
+            df_lazy = self._clean_lazy(df_clean, config)
+
+        if df_lazy is not None:
+            df_clean = df_lazy
+        else:
+            df_clean = self._clean_eager(df_clean, config)
+
+        # Update final statistics
+        self.cleaning_stats['final_rows'] = len(df_clean)
+        self.cleaning_stats['final_columns'] = len(df_clean.columns)
+        self.cleaning_stats['rows_removed'] = original_shape[0] - len(df_clean)
+        self.cleaning_stats['columns_removed'] = original_shape[1] - len(df_clean.columns)
+
+        logger.info(
+            f"Data cleaning completed. Output shape: {df_clean.shape}. "
+            f"Removed {self.cleaning_stats['rows_removed']} rows, "
+            f"{self.cleaning_stats['columns_removed']} columns"
+        )
+
+        return df_clean
+
+    def _clean_eager(
+        self,
+        df: pd.DataFrame,
+        config: Dict[str, Any]
+    ) -> pd.DataFrame:
+        """Run the cleaning steps one at a time with pandas."""
+        df_clean = df
+
         # Remove completely empty rows
         if config.get('drop_empty_rows', True):
             df_clean = self._drop_empty_rows(df_clean)
 
+        # Apply rules that no later step can affect before the heavier work
+        custom_rules = config.get('custom_rules', [])
+        if custom_rules and config.get('pushdown_rules', False):
+            early_rules, custom_rules = self._split_pushdown_rules(
+                df_clean, custom_rules, config
+            )
+            if early_rules:
+                df_clean = self._apply_custom_rules(df_clean, early_rules)
+
         # Handle duplicates
         if config.get('drop_duplicates', True):
-            df_clean = self._drop_duplicates(df_clean)
+            df_clean = self._drop_duplicates(df_clean, config.get('duplicate_subset'))
 
         # Standardize string columns
         if config.get('standardize_strings', True):
-            df_clean = self._standardize_strings(df_clean)
+            df_clean = self._standardize_strings(df_clean, _string_columns(df_clean))
 
         # Convert date columns
         if 'date_columns' in config:
@@ -97,34 +276,218 @@ class DataCleaner:
 
         # Convert numeric columns
         if 'numeric_columns' in config:
-            df_clean = self._convert_numeric(df_clean, config['numeric_columns'])
+            df_clean = self._convert_numeric(
+                df_clean,
+                config['numeric_columns'],
+                downcast=config.get('downcast_numeric', False)
+            )
+
+        # Numeric dtypes are settled once conversions are done; later steps
+        # keep them, so the column list is computed a single time
+        numeric_cols = None
+        if config.get('fill_missing') == 'mean' or config.get('remove_outliers', False):
+            numeric_cols = df_clean.select_dtypes(include=[np.number]).columns.tolist()
 
         # Handle missing values
         if 'fill_missing' in config:
-            df_clean = self._handle_missing(df_clean, config['fill_missing'])
+            df_clean = self._handle_missing(
+                df_clean, config['fill_missing'], numeric_cols
+            )
 
         # Remove outliers
         if config.get('remove_outliers', False):
-            numeric_cols = df_clean.select_dtypes(include=[np.number]).columns.tolist()
-            if 'numeric_columns' in config:
-                numeric_cols = config['numeric_columns']
-            df_clean = self._remove_outliers(df_clean, numeric_cols)
+            outlier_cols = config.get('numeric_columns', numeric_cols)
+            df_clean = self._remove_outliers(
+                df_clean, outlier_cols, use_numba=config.get('use_numba', False)
+            )
 
         # Apply custom validation rules
-        if 'custom_rules' in config:
-            df_clean = self._apply_custom_rules(df_clean, config['custom_rules'])
+        if custom_rules:
+            df_clean = self._apply_custom_rules(df_clean, custom_rules)
 
-        # Update final statistics
-        self.cleaning_stats['final_rows'] = len(df_clean)
-        self.cleaning_stats['final_columns'] = len(df_clean.columns)
-        self.cleaning_stats['rows_removed'] = original_shape[0] - len(df_clean)
-        self.cleaning_stats['columns_removed'] = original_shape[1] - len(df_clean.columns)
+        return df_clean
 
-        logger.info(
-            f"Data cleaning completed. Output shape: {df_clean.shape}. "
-            f"Removed {self.cleaning_stats['rows_removed']} rows, "
-            f"{self.cleaning_stats['columns_removed']} columns"
-        )
+    def _split_pushdown_rules(
+        self,
+        df: pd.DataFrame,
+        rules: List[Dict[str, Any]],
+        config: Dict[str, Any]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Split custom rules into those safe to apply early and the rest.
+
+        A rule is safe when no later step can change its column's values:
+        the column is not converted, not a string column being stripped,
+        and has no missing values that fill_missing would replace. Dropping
+        its rows early must also leave the other steps' results alone, so
+        a duplicate_subset has to include the column, and nothing may be
+        filled or bounded from neighbouring or all rows (forward, backward
+        or mean fills, outlier removal); with those, no rule moves.
+
+        Returns:
+            Tuple of (early rules, remaining rules)
+        """
+        if config.get('fill_missing') in ('forward', 'backward', 'mean') \
+                or config.get('remove_outliers', False):
+            return [], list(rules)
+
+        converted = set(_date_column_formats(config.get('date_columns', [])))
+        converted.update(config.get('numeric_columns', []))
+        standardize = config.get('standardize_strings', True)
+        fills = 'fill_missing' in config
+
+        # Same subset resolution as _drop_duplicates; empty means whole rows
+        duplicate_subset = []
+        if config.get('drop_duplicates', True):
+            duplicate_subset = [
+                col for col in config.get('duplicate_subset') or [] if col in df.columns
+            ]
+
+        early, remaining = [], []
+
+        for rule in rules:
+            column = rule.get('column')
+            safe = (
+                column in df.columns
+                and column not in converted
+                and not (duplicate_subset and column not in duplicate_subset)
+                and not (standardize and pd.api.types.is_string_dtype(df[column].dtype))
+                and not (fills and df[column].isna().any())
+            )
+            (early if safe else remaining).append(rule)
+
+        if early:
+            logger.info(f"Applying {len(early)} custom rules before conversions")
+
+        return early, remaining
+
+    def _clean_lazy(
+        self,
+        df: pd.DataFrame,
+        config: Dict[str, Any]
+    ) -> Optional[pd.DataFrame]:
+        """
+        Run the cleaning steps as a single Polars lazy query.
+
+        The query is collected once so Polars can fuse filters and casts.
+        Per-step row counts are not available; the whole pipeline is
+        recorded as one operation. Returns None when polars is missing or
+        the frame cannot be converted, so the caller can fall back to the
+        pandas engine.
+        """
+        try:
+            import polars as pl
+        except ImportError:
+            logger.warning("Cleaning engine 'polars' requested but polars is not installed")
+            return None
+
+        try:
+            lf = pl.from_pandas(df).lazy()
+        except Exception as e:
+            logger.warning(f"Could not convert data for polars engine, using pandas: {str(e)}")
+            return None
+
+        if config.get('drop_empty_rows', True):
+            lf = lf.filter(~pl.all_horizontal(pl.all().is_null()))
+
+        if config.get('drop_duplicates', True):
+            subset = [
+                col for col in config.get('duplicate_subset') or [] if col in df.columns
+            ]
+            lf = lf.unique(subset=subset or None, keep='first', maintain_order=True)
+
+        if config.get('standardize_strings', True):
+            lf = lf.with_columns(pl.col(pl.String).str.strip_chars())
+
+        schema = lf.collect_schema()
+
+        date_formats = {
+            col: fmt
+            for col, fmt in _date_column_formats(config.get('date_columns', [])).items()
+            if schema.get(col) == pl.String
+        }
+        if date_formats:
+            lf = lf.with_columns(
+                pl.col(col).str.to_datetime(format=fmt, time_unit='ns', strict=False)
+                for col, fmt in date_formats.items()
+            )
+
+        numeric_columns = [
+            col for col in config.get('numeric_columns', []) if col in schema
+        ]
+        if numeric_columns:
+            lf = lf.with_columns(
+                pl.col(col).cast(pl.Float64, strict=False)
+                for col in numeric_columns
+                if not schema[col].is_numeric()
+            )
+
+        schema = lf.collect_schema()
+
+        strategy = config.get('fill_missing')
+        if strategy == 'drop':
+            lf = lf.drop_nulls()
+        elif strategy == 'forward':
+            lf = lf.select(pl.all().forward_fill())
+        elif strategy == 'backward':
+            lf = lf.select(pl.all().backward_fill())
+        elif strategy == 'mean':
+            lf = lf.with_columns(
+                pl.col(col).fill_null(pl.col(col).mean())
+                for col, dtype in schema.items() if dtype.is_numeric()
+            )
+        elif strategy == 'zero':
+            # Unlike pandas, polars cannot write 0 into non-numeric columns
+            lf = lf.with_columns(pl.selectors.numeric().fill_null(0))
+        elif strategy is not None:
+            logger.warning(f"Unknown missing value strategy: {strategy}")
+
+        if config.get('remove_outliers', False):
+            outlier_columns = config.get('numeric_columns') or list(schema)
+            for col in outlier_columns:
+                if schema.get(col) not in (pl.Float64, pl.Int64):
+                    continue
+                # One filter per column so its quartiles come from the rows
+                # left by the previous columns; missing values are dropped
+                q1 = pl.col(col).quantile(0.25, interpolation='linear')
+                q3 = pl.col(col).quantile(0.75, interpolation='linear')
+                iqr = q3 - q1
+                lf = lf.filter(pl.col(col).is_between(q1 - 1.5 * iqr, q3 + 1.5 * iqr))
+
+        rule_predicates = []
+
+        for rule in config.get('custom_rules', []):
+            column = rule.get('column')
+            condition = rule.get('condition')
+            value = rule.get('value')
+
+            if column not in schema:
+                logger.warning(f"Column '{column}' not found for custom rule")
+                continue
+
+            if condition in ('in', 'not_in'):
+                predicate = pl.col(column).is_in(value)
+                if condition == 'not_in':
+                    predicate = ~predicate
+            elif condition in RULE_OPERATIONS:
+                predicate = RULE_OPERATIONS[condition](pl.col(column), value)
+            else:
+                continue
+
+            rule_predicates.append(predicate.fill_null(False))
+
+        # Custom rules see the frame after outlier removal, as in pandas
+        if rule_predicates:
+            lf = lf.filter(pl.all_horizontal(rule_predicates))
+
+        df_clean = lf.collect().to_pandas()
+
+        removed = len(df) - len(df_clean)
+        logger.info(f"Polars cleaning pipeline removed {removed} rows")
+        self.cleaning_stats['operations'].append({
+            'operation': 'lazy_pipeline',
+            'rows_removed': removed
+        })
 
         return df_clean
 
@@ -142,12 +505,20 @@ class DataCleaner:
         return df
 
     def _drop_empty_rows(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Remove rows where all values are NaN."""
-        before = len(df)
-        df = df.dropna(how='all')
-        removed = before - len(df)
+        """
+        Remove rows where all values are NaN.
+
+        The all-missing row mask is computed once; when no row is empty
+        the frame is returned without the copy dropna would make.
+        """
+        if len(df.columns) == 0:
+            return df
+
+        empty = df.isna().to_numpy().all(axis=1)
+        removed = int(empty.sum())
 
         if removed > 0:
+            df = df.loc[~empty]
             logger.info(f"Removed {removed} completely empty rows")
             self.cleaning_stats['operations'].append({
                 'operation': 'drop_empty_rows',
@@ -156,13 +527,25 @@ class DataCleaner:
 
         return df
 
-    def _drop_duplicates(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Remove duplicate rows."""
-        before = len(df)
-        df = df.drop_duplicates()
-        removed = before - len(df)
+    def _drop_duplicates(
+        self,
+        df: pd.DataFrame,
+        subset: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Remove duplicate rows.
+
+        Only the subset columns are hashed when given. The frame is
+        returned untouched when there is nothing to drop.
+        """
+        if subset:
+            subset = [col for col in subset if col in df.columns] or None
+
+        duplicated = df.duplicated(subset=subset).to_numpy()
+        removed = int(duplicated.sum())
 
         if removed > 0:
+            df = df.loc[~duplicated]
             logger.info(f"Removed {removed} duplicate rows")
             self.cleaning_stats['operations'].append({
                 'operation': 'drop_duplicates',
@@ -171,72 +554,125 @@ class DataCleaner:
 
         return df
 
-    def _standardize_strings(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _standardize_strings(
+        self,
+        df: pd.DataFrame,
+        string_columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
         """Trim whitespace and standardize string columns."""
-        string_columns = df.select_dtypes(include=['object']).columns
+        if string_columns is None:
+            string_columns = _string_columns(df)
+        stripped = {}
 
         for col in string_columns:
-            # Only process if column contains strings
-            if df[col].dtype == 'object':
-                df[col] = df[col].apply(
+            if pd.api.types.infer_dtype(df[col], skipna=True) == 'string':
+                # All values are strings (or missing): vectorized strip
+                stripped[col] = df[col].str.strip()
+            else:
+                # Mixed column: strip strings, keep other values verbatim
+                stripped[col] = df[col].apply(
                     lambda x: x.strip() if isinstance(x, str) else x
                 )
 
         if len(string_columns) > 0:
             logger.info(f"Standardized {len(string_columns)} string columns")
 
-        return df
+        return df.assign(**stripped) if stripped else df
 
     def _convert_dates(
         self,
         df: pd.DataFrame,
-        date_columns: List[str]
+        date_columns: Union[List[Any], Dict[str, Optional[str]]]
     ) -> pd.DataFrame:
-        """Convert specified columns to datetime."""
-        converted = []
+        """
+        Convert specified columns to datetime.
+
+        Columns with a configured format are parsed with it directly.
+        Otherwise ISO 8601 strings take the C fast path, falling back to
+        format inference when any value is not ISO 8601. Numeric columns
+        are parsed as before, as nanoseconds since the epoch.
+        """
+        converted = {}
 
-        for col in date_columns:
+        for col, fmt in _date_column_formats(date_columns).items():
             if col in df.columns:
                 try:
-                    df[col] = pd.to_datetime(df[col], errors='coerce')
-                    converted.append(col)
+                    series = df[col]
+                    if fmt:
+                        converted[col] = pd.to_datetime(
+                            series, errors='coerce', format=fmt, cache=True
+                        )
+                    elif pd.api.types.is_datetime64_any_dtype(series):
+                        continue
+                    elif pd.api.types.is_numeric_dtype(series):
+                        # No unit is given, so numbers keep the pandas
+                        # default of nanoseconds since the epoch
+                        converted[col] = pd.to_datetime(
+                            series, errors='coerce', cache=True
+                        )
+                    else:
+                        try:
+                            converted[col] = pd.to_datetime(
+                                series, format='ISO8601', cache=True
+                            )
+                        except (ValueError, TypeError):
+                            converted[col] = pd.to_datetime(
+                                series, errors='coerce', cache=True
+                            )
                 except Exception as e:
                     logger.warning(f"Failed to convert column '{col}' to datetime: {str(e)}")
 
         if converted:
-            logger.info(f"Converted {len(converted)} columns to datetime: {converted}")
+            logger.info(f"Converted {len(converted)} columns to datetime: {list(converted)}")
 
-        return df
+        return df.assign(**converted) if converted else df
 
     def _convert_numeric(
         self,
         df: pd.DataFrame,
-        numeric_columns: List[str]
+        numeric_columns: List[str],
+        downcast: bool = False
     ) -> pd.DataFrame:
-        """Convert specified columns to numeric."""
-        converted = []
+        """
+        Convert specified columns to numeric.
+
+        With downcast enabled, complete whole-number columns shrink to the
+        smallest integer dtype and other columns to float32 where pandas
+        can do so, reducing the bytes scanned by later steps.
+        """
+        converted = {}
 
         for col in numeric_columns:
             if col in df.columns:
                 try:
-                    df[col] = pd.to_numeric(df[col], errors='coerce')
-                    converted.append(col)
+                    series = pd.to_numeric(df[col], errors='coerce')
+                    if downcast and pd.api.types.is_numeric_dtype(series):
+                        values = series.to_numpy()
+                        if not np.isnan(values).any() and (values % 1 == 0).all():
+                            series = pd.to_numeric(series, downcast='integer')
+                        else:
+                            series = pd.to_numeric(series, downcast='float')
+                    converted[col] = series
                 except Exception as e:
                     logger.warning(f"Failed to convert column '{col}' to numeric: {str(e)}")
 
         if converted:
-            logger.info(f"Converted {len(converted)} columns to numeric: {converted}")
+            logger.info(f"Converted {len(converted)} columns to numeric: {list(converted)}")
 
-        return df
+        return df.assign(**converted) if converted else df
 
     def _handle_missing(
         self,
         df: pd.DataFrame,
-        strategy: str
+        strategy: str,
+        numeric_columns: Optional[List[str]] = None
     ) -> pd.DataFrame:
         """
         Handle missing values according to strategy.
 
+        numeric_columns, when given, lists the numeric columns for the
+        'mean' strategy so they are not looked up again.
+
         Strategies:
             - 'drop': Drop rows with any missing values
             - 'forward': Forward fill missing values
@@ -244,7 +680,10 @@ class DataCleaner:
             - 'mean': Fill with column mean (numeric only)
             - 'zero': Fill with zero
         """
-        before_missing = df.isnull().sum().sum()
+        # Missing-value counts are only needed for the log line
+        log_counts = logger.isEnabledFor(logging.INFO)
+        if log_counts:
+            before_missing = int(df.isna().to_numpy().sum())
 
         if strategy == 'drop':
             df = df.dropna()
@@ -253,46 +692,114 @@ class DataCleaner:
         elif strategy == 'backward':
             df = df.bfill()
         elif strategy == 'mean':
-            numeric_cols = df.select_dtypes(include=[np.number]).columns
-            df[numeric_cols] = df[numeric_cols].fillna(df[numeric_cols].mean())
+            df = self._fill_mean(df, numeric_columns)
         elif strategy == 'zero':
-            df = df.fillna(0)
+            # Typed string columns (e.g. string[pyarrow]) reject the integer
+            # 0; they are filled with the text '0' instead
+            text_fill = {
+                col: '0' for col, dtype in df.dtypes.items()
+                if pd.api.types.is_string_dtype(dtype)
+                and not pd.api.types.is_object_dtype(dtype)
+            }
+            if text_fill:
+                df = df.fillna({**dict.fromkeys(df.columns, 0), **text_fill})
+            else:
+                df = df.fillna(0)
         else:
             logger.warning(f"Unknown missing value strategy: {strategy}")
 
-        after_missing = df.isnull().sum().sum()
+        if log_counts:
+            # Dropping or zero-filling leaves nothing missing; no rescan needed
+            if strategy in ('drop', 'zero'):
+                after_missing = 0
+            else:
+                after_missing = int(df.isna().to_numpy().sum())
 
-        logger.info(
-            f"Handled missing values using '{strategy}' strategy. "
-            f"Missing values reduced from {before_missing} to {after_missing}"
-        )
+            logger.info(
+                f"Handled missing values using '{strategy}' strategy. "
+                f"Missing values reduced from {before_missing} to {after_missing}"
+            )
 
         return df
 
+    def _fill_mean(
+        self,
+        df: pd.DataFrame,
+        numeric_columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Fill missing numeric values with their column mean.
+
+        NumPy float columns are filled from one matrix pass; other numeric
+        columns (nullable extension dtypes) go through pandas fillna.
+        """
+        if numeric_columns is None:
+            numeric_columns = df.select_dtypes(include=[np.number]).columns.tolist()
+
+        float_cols = [
+            col for col in numeric_columns
+            if isinstance(df[col].dtype, np.dtype) and df[col].dtype.kind == 'f'
+        ]
+        other_cols = [col for col in numeric_columns if col not in float_cols]
+
+        filled = {}
+
+        if float_cols:
+            values = df[float_cols].to_numpy(dtype=np.float64)
+            missing = np.isnan(values)
+
+            if missing.any():
+                counts = (~missing).sum(axis=0)
+                sums = np.where(missing, 0.0, values).sum(axis=0)
+                means = np.divide(
+                    sums, counts, out=np.full(len(float_cols), np.nan), where=counts > 0
+                )
+
+                rows, cols = np.nonzero(missing)
+                values[rows, cols] = means[cols]
+
+                for idx in np.unique(cols):
+                    col = float_cols[idx]
+                    filled[col] = pd.Series(
+                        values[:, idx].astype(df[col].dtype, copy=False),
+                        index=df.index
+                    )
+
+        if len(other_cols) > 0:
+            filled.update(df[other_cols].fillna(df[other_cols].mean()).items())
+
+        return df.assign(**filled) if filled else df
+
     def _remove_outliers(
         self,
         df: pd.DataFrame,
-        numeric_columns: List[str]
+        numeric_columns: List[str],
+        use_numba: bool = False
     ) -> pd.DataFrame:
-        """Remove outliers using IQR method."""
-        before = len(df)
+        """
+        Remove outliers using IQR method.
 
-        for col in numeric_columns:
-            if col not in df.columns:
-                continue
+        The numeric columns are read into one float64 block, the row mask
+        is built on it and the frame is sliced once. Results match
+        filtering column by column: each column's bounds come from the rows
+        surviving the previous columns, and missing values are dropped.
+        With use_numba, the mask is built by a compiled kernel.
+        """
+        before = len(df)
 
-            if df[col].dtype in [np.float64, np.int64]:
-                Q1 = df[col].quantile(0.25)
-                Q3 = df[col].quantile(0.75)
-                IQR = Q3 - Q1
+        columns = [
+            col for col in numeric_columns
+            if col in df.columns
+            and isinstance(df[col].dtype, np.dtype) and df[col].dtype.kind in 'iuf'
+        ]
 
-                lower_bound = Q1 - 1.5 * IQR
-                upper_bound = Q3 + 1.5 * IQR
+        if columns and before:
+            values = df[columns].to_numpy(dtype=np.float64)
+            kernel = _get_numba_iqr_mask() if use_numba else None
+            mask = kernel(values) if kernel is not None else _iqr_mask(values)
 
-                df = df[
-                    (df[col] >= lower_bound) &
-                    (df[col] <= upper_bound)
-                ]
+            if not mask.all():
+                df = df.loc[mask]
 
         removed = before - len(df)
 
@@ -318,6 +825,8 @@ class DataCleaner:
             - condition: Condition type ('>', '<', '>=', '<=', '==', '!=', 'in', 'not_in')
             - value: Value to compare against
         """
+        mask = np.ones(len(df), dtype=bool)
+
         for rule in rules:
             column = rule.get('column')
             condition = rule.get('condition')
@@ -327,31 +836,26 @@ class DataCleaner:
                 logger.warning(f"Column '{column}' not found for custom rule")
                 continue
 
-            before = len(df)
-
-            if condition == '>':
-                df = df[df[column] > value]
-            elif condition == '<':
-                df = df[df[column] < value]
-            elif condition == '>=':
-                df = df[df[column] >= value]
-            elif condition == '<=':
-                df = df[df[column] <= value]
-            elif condition == '==':
-                df = df[df[column] == value]
-            elif condition == '!=':
-                df = df[df[column] != value]
-            elif condition == 'in':
-                df = df[df[column].isin(value)]
-            elif condition == 'not_in':
-                df = df[~df[column].isin(value)]
-
-            removed = before - len(df)
+            operation = RULE_OPERATIONS.get(condition)
+            if operation is None:
+                continue
+
+            rule_mask = operation(df[column], value)
+            if isinstance(rule_mask, pd.Series):
+                rule_mask = rule_mask.fillna(False).to_numpy(dtype=bool)
+
+            removed = int((mask & ~rule_mask).sum())
+            mask &= rule_mask
+
             if removed > 0:
                 logger.info(
                     f"Custom rule '{column} {condition} {value}' removed {removed} rows"
                 )
 
+        # Materialize the filtered frame once for all rules
+        if not mask.all():
+            df = df.loc[mask]
+
         return df
 
     def get_cleaning_stats(self) -> Dict[str, Any]:
@@ -5,5 +5,6 @@ from .csv_reader import CSVReader
 from .excel_reader import ExcelReader
 from .api_reader import APIReader
 from .folder_reader import FolderReader
+from .parquet_reader import ParquetReader
 
-__all__ = ['DataReader', 'CSVReader', 'ExcelReader', 'APIReader', 'FolderReader']
+__all__ = ['DataReader', 'CSVReader', 'ExcelReader', 'APIReader', 'FolderReader', 'ParquetReader']
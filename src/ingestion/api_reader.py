@@ -6,13 +6,130 @@ Reads data from REST APIs with support for authentication and pagination.
 
 import pandas as pd
 import requests
-from typing import Dict, Any, List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Any, List, Optional, Tuple
 from .base import DataReader
 from ..utils.logger import setup_logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = setup_logger(__name__)
 
 
+# Retry policy for transient API failures
+RETRY_TOTAL = 5
+RETRY_BACKOFF_FACTOR = 0.3
+RETRY_STATUS_CODES = [429, 502, 503, 504]
+
+# Parallel page requests when the total page count is known; the shared
+# session keeps this many connections per host, so larger settings are capped
+DEFAULT_PAGE_CONCURRENCY = 8
+MAX_PAGE_CONCURRENCY = 32
+
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+_MISSING = object()
+
+
+def _get_session() -> requests.Session:
+    """
+    Return the shared HTTP session, creating it on first use.
+
+    Reusing one session keeps TCP/TLS connections alive across requests
+    and pages. Transient failures are retried with exponential backoff.
+    The connection pool holds one connection per concurrent page request.
+    """
+    global _SESSION
+
+    # Sources are read from several threads; create the session only once
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            retry = Retry(
+                total=RETRY_TOTAL,
+                backoff_factor=RETRY_BACKOFF_FACTOR,
+                status_forcelist=RETRY_STATUS_CODES
+            )
+            adapter = HTTPAdapter(max_retries=retry, pool_maxsize=MAX_PAGE_CONCURRENCY)
+
+            session = requests.Session()
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            session.headers['Accept-Encoding'] = 'gzip, deflate'
+            _SESSION = session
+
+    return _SESSION
+
+
+def _decode_json(response: requests.Response) -> Any:
+    """
+    Decode a JSON response body, using orjson when it is installed.
+
+    Bodies orjson rejects (e.g. NaN literals or integers wider than
+    64 bits) are decoded again with the standard library parser.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            pass
+
+    return response.json()
+
+
+def _extract_path(payload: Any, path: Optional[str], default: Any = _MISSING) -> Any:
+    """
+    Follow a dotted key path (e.g. 'data.items') into a JSON payload.
+
+    Raises KeyError for a missing key unless a default is given.
+    """
+    if not path:
+        return payload
+
+    for key in path.split('.'):
+        try:
+            payload = payload[key]
+        except (KeyError, TypeError):
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+
+    return payload
+
+
+def _records_to_frame_arrow(records: List[Any]) -> pd.DataFrame:
+    """
+    Build a DataFrame from JSON records through a typed Arrow table.
+
+    Arrow infers one type per field across all records and fills typed
+    buffers directly, avoiding pandas' per-row dict transpose. Falls back
+    to the pandas constructor when pyarrow is missing or a field mixes
+    incompatible types.
+    """
+    if not records:
+        return pd.DataFrame(records)
+
+    try:
+        import pyarrow as pa
+    except ImportError:
+        logger.warning("API engine 'pyarrow' requested but pyarrow is not installed")
+        return pd.DataFrame(records)
+
+    try:
+        table = pa.Table.from_struct_array(pa.array(records))
+    except (pa.ArrowException, TypeError, ValueError) as e:
+        logger.warning(f"Arrow could not infer API record types, using pandas: {str(e)}")
+        return pd.DataFrame(records)
+
+    return table.to_pandas()
+
+
 class APIReader(DataReader):
     """
     Read data from REST APIs.
@@ -29,6 +146,19 @@ class APIReader(DataReader):
         - data_path: JSON path to data array (e.g., 'data.items')
         - timeout: Request timeout in seconds (default: 30)
         - verify_ssl: Verify SSL certificates (default: True)
+        - pagination: Pagination settings (default: None - single request)
+            - type: 'cursor', 'next_url' or 'page' (default: 'cursor')
+            - cursor_path: JSON path to the next cursor (type 'cursor')
+            - next_path: JSON path to the next page URL (type 'next_url')
+            - param: Query parameter for the cursor or page number
+              (default: 'cursor' / 'page')
+            - max_pages: Upper bound on requests (default: 1000)
+            - total_pages_path: JSON path to the total page count (type
+              'page'); when set, pages after the first are fetched
+              concurrently
+            - concurrency: Parallel page requests, at most 32 (default: 8)
+        - engine: 'pyarrow' builds the DataFrame through Arrow's typed
+          builders; requires pyarrow (default: pandas constructor)
 
     Example:
         >>> config = {
@@ -87,40 +217,111 @@ class APIReader(DataReader):
             )
 
         # Query parameters
-        params = self.source_config.get('params', {})
+        params = dict(self.source_config.get('params', {}))
+        pagination = self.source_config.get('pagination')
+        data_path = self.source_config.get('data_path')
 
         logger.info(f"Requesting data from API: {url}")
 
-        try:
-            response = requests.request(
+        session = _get_session()
+        request_kwargs = {
+            'headers': headers,
+            'auth': auth,
+            'timeout': timeout,
+            'verify': verify_ssl
+        }
+
+        records: List[Any] = []
+
+        def fetch(page_url: str, page_params: Dict[str, Any]) -> Tuple[Any, Any]:
+            """Request one page and return its payload and extracted data."""
+            response = session.request(
                 method=method,
-                url=url,
-                headers=headers,
-                params=params,
-                auth=auth,
-                timeout=timeout,
-                verify=verify_ssl
+                url=page_url,
+                params=page_params,
+                **request_kwargs
             )
 
             response.raise_for_status()
 
             # Parse JSON response
-            data = response.json()
+            payload = _decode_json(response)
 
             # Extract data from nested path if specified
-            data_path = self.source_config.get('data_path')
-            if data_path:
-                for key in data_path.split('.'):
-                    data = data[key]
+            data = _extract_path(payload, data_path)
+
+            if not isinstance(data, (list, dict)):
+                raise ValueError(f"Unexpected API response type: {type(data)}")
+
+            return payload, data
 
-            # Convert to DataFrame
+        def collect(data: Any) -> None:
+            """Append one page's data to the accumulated records."""
             if isinstance(data, list):
-                df = pd.DataFrame(data)
-            elif isinstance(data, dict):
+                records.extend(data)
+            else:
                 # If single object, wrap in list
-                df = pd.DataFrame([data])
+                records.append(data)
+
+        try:
+            page_url = url
+            page_number = 1
+            max_pages = pagination.get('max_pages', 1000) if pagination else 1
+
+            for _ in range(max_pages):
+                payload, data = fetch(page_url, params)
+                collect(data)
+
+                if not pagination or not data:
+                    break
+
+                # Work out the next request; stop when the API has no more pages
+                page_type = pagination.get('type', 'cursor')
+
+                if page_type == 'cursor':
+                    cursor = _extract_path(payload, pagination['cursor_path'], default=None)
+                    if not cursor:
+                        break
+                    params[pagination.get('param', 'cursor')] = cursor
+                elif page_type == 'next_url':
+                    next_url = _extract_path(payload, pagination['next_path'], default=None)
+                    if not next_url:
+                        break
+                    # The next URL already carries the query string
+                    page_url, params = next_url, {}
+                elif page_type == 'page':
+                    page_param = pagination.get('param', 'page')
+                    total_path = pagination.get('total_pages_path')
+
+                    if total_path and page_number == 1:
+                        # Page count is known: fetch the rest concurrently,
+                        # keeping page order in the combined records
+                        total_pages = int(_extract_path(payload, total_path))
+                        pages = range(2, min(total_pages, max_pages) + 1)
+                        workers = max(1, min(
+                            pagination.get('concurrency', DEFAULT_PAGE_CONCURRENCY),
+                            MAX_PAGE_CONCURRENCY
+                        ))
+
+                        with ThreadPoolExecutor(max_workers=workers) as executor:
+                            results = executor.map(
+                                lambda page: fetch(url, {**params, page_param: page}),
+                                pages
+                            )
+                            for _, page_data in results:
+                                collect(page_data)
+                        break
+
+                    page_number += 1
+                    params[page_param] = page_number
+                else:
+                    raise ValueError(f"Unknown pagination type: {page_type}")
+
+            # Convert to DataFrame once all pages are collected
+            if self.source_config.get('engine') == 'pyarrow':
+                df = _records_to_frame_arrow(records)
             else:
-                raise ValueError(f"Unexpected API response type: {type(data)}")
+                df = pd.DataFrame(records)
 
             logger.info(f"Successfully retrieved {len(df)} rows from API")
             return df
@@ -6,12 +6,15 @@ Reads data from CSV files with configurable encoding and delimiter.
 
 import pandas as pd
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, Optional
 from .base import DataReader
 from ..utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Rows per chunk when streaming without an explicit chunk_size
+DEFAULT_CHUNK_SIZE = 100000
+
 
 class CSVReader(DataReader):
     """
@@ -22,6 +25,16 @@ class CSVReader(DataReader):
         - encoding: File encoding (default: 'utf-8')
         - delimiter: Column delimiter (default: ',')
         - skip_rows: Number of rows to skip (default: 0)
+        - engine: Parser engine; 'pyarrow' enables the multi-threaded Arrow
+          parser and requires pyarrow (default: pandas C parser)
+        - dtype: Column name to dtype mapping, skips type inference for
+          those columns (default: None)
+        - columns: Only read these columns (default: all columns)
+        - chunk_size: Rows per chunk yielded by iter_chunks(); read()
+          always parses the whole file in one pass (default: 100000)
+        - arrow_dtypes: With engine 'pyarrow', keep the parsed Arrow buffers
+          as Arrow-backed pandas dtypes instead of converting them to NumPy
+          dtypes (default: False)
 
     Example:
         >>> config = {'path': 'data/input/activities.csv'}
@@ -45,25 +58,28 @@ class CSVReader(DataReader):
             FileNotFoundError: If CSV file doesn't exist
             pd.errors.ParserError: If CSV parsing fails
         """
-        file_path = Path(self.source_config['path'])
-
-        if not file_path.exists():
-            raise FileNotFoundError(f"CSV file not found: {file_path}")
-
-        # Get optional parameters
-        encoding = self.source_config.get('encoding', 'utf-8')
-        delimiter = self.source_config.get('delimiter', ',')
-        skip_rows = self.source_config.get('skip_rows', 0)
+        file_path = self._get_file_path()
+        engine = self.source_config.get('engine')
+        read_kwargs = self._get_read_kwargs()
 
         logger.info(f"Reading CSV file: {file_path}")
 
         try:
-            df = pd.read_csv(
-                file_path,
-                encoding=encoding,
-                delimiter=delimiter,
-                skiprows=skip_rows
-            )
+            if engine == 'pyarrow':
+                try:
+                    arrow_kwargs = {}
+                    if self.source_config.get('arrow_dtypes', False):
+                        arrow_kwargs['dtype_backend'] = 'pyarrow'
+                    df = pd.read_csv(file_path, engine='pyarrow', **read_kwargs, **arrow_kwargs)
+                except (ImportError, ValueError) as e:
+                    # Missing pyarrow or options the Arrow parser rejects
+                    logger.warning(
+                        f"pyarrow CSV engine failed for {file_path}, "
+                        f"using default parser: {str(e)}"
+                    )
+                    df = pd.read_csv(file_path, **read_kwargs)
+            else:
+                df = pd.read_csv(file_path, **read_kwargs)
 
             logger.info(f"Successfully read {len(df)} rows from {file_path}")
             return df
@@ -71,3 +87,50 @@ class CSVReader(DataReader):
         except Exception as e:
             logger.error(f"Failed to read CSV file {file_path}: {str(e)}")
             raise
+
+    def iter_chunks(self, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """
+        Stream the CSV file as DataFrames of at most chunk_size rows.
+
+        Memory stays proportional to the chunk size only while each chunk
+        is processed and released before the next; collecting the chunks
+        into one frame costs more than read().
+
+        Args:
+            chunk_size: Rows per chunk (default: 'chunk_size' from
+                        configuration, or 100000)
+
+        Yields:
+            DataFrame chunks in file order
+
+        Raises:
+            FileNotFoundError: If CSV file doesn't exist
+        """
+        file_path = self._get_file_path()
+
+        if chunk_size is None:
+            chunk_size = self.source_config.get('chunk_size') or DEFAULT_CHUNK_SIZE
+
+        # The Arrow parser does not support chunked reads; use the C parser
+        with pd.read_csv(file_path, chunksize=chunk_size, **self._get_read_kwargs()) as chunks:
+            for chunk in chunks:
+                yield chunk
+
+    def _get_file_path(self) -> Path:
+        """Return the configured CSV path, checking that it exists."""
+        file_path = Path(self.source_config['path'])
+
+        if not file_path.exists():
+            raise FileNotFoundError(f"CSV file not found: {file_path}")
+
+        return file_path
+
+    def _get_read_kwargs(self) -> Dict[str, Any]:
+        """Build pd.read_csv keyword arguments from configuration."""
+        return {
+            'encoding': self.source_config.get('encoding', 'utf-8'),
+            'delimiter': self.source_config.get('delimiter', ','),
+            'skiprows': self.source_config.get('skip_rows', 0),
+            'dtype': self.source_config.get('dtype'),
+            'usecols': self.source_config.get('columns')
+        }
@@ -1,30 +1,81 @@
 """
 Folder reader for the activity reporting system.
 
-Reads and combines multiple CSV/Excel files from a folder.
+Reads and combines multiple CSV/Excel/Parquet files from a folder.
 """
 
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from .base import DataReader
 from .csv_reader import CSVReader
 from .excel_reader import ExcelReader
+from .parquet_reader import ParquetReader
 from ..utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 
+def _read_one(file_path: Path, source_config: Dict[str, Any]) -> Optional[pd.DataFrame]:
+    """
+    Read a single file from the folder with the matching reader.
+
+    Args:
+        file_path: Path to the CSV, Excel or Parquet file
+        source_config: Folder source configuration
+
+    Returns:
+        DataFrame with a '_source_file' column, or None if the file is
+        unsupported or could not be read
+    """
+    try:
+        # Determine file type and read accordingly
+        if file_path.suffix.lower() in ['.csv', '.txt']:
+            file_config = {
+                'path': str(file_path),
+                'encoding': source_config.get('encoding', 'utf-8'),
+                'delimiter': source_config.get('delimiter', ',')
+            }
+            reader = CSVReader(file_config)
+        elif file_path.suffix.lower() in ['.xlsx', '.xls']:
+            file_config = {
+                'path': str(file_path),
+                'sheet_name': source_config.get('sheet_name', 0)
+            }
+            reader = ExcelReader(file_config)
+        elif file_path.suffix.lower() == '.parquet':
+            reader = ParquetReader({'path': str(file_path)})
+        else:
+            logger.warning(f"Skipping unsupported file type: {file_path}")
+            return None
+
+        df = reader.read()
+
+        # Add source file column
+        df['_source_file'] = file_path.name
+
+        return df
+
+    except Exception as e:
+        logger.warning(f"Failed to read file {file_path}: {str(e)}")
+        return None
+
+
 class FolderReader(DataReader):
     """
     Read and combine multiple files from a folder.
 
     Configuration parameters:
         - path: Path to folder (required)
-        - pattern: File pattern (e.g., '*.csv', '*.xlsx') (default: '*.csv')
+        - pattern: File pattern (e.g., '*.csv', '*.xlsx', '*.parquet') (default: '*.csv')
         - recursive: Search subdirectories (default: False)
         - encoding: File encoding for CSV files (default: 'utf-8')
         - delimiter: Delimiter for CSV files (default: ',')
+        - max_workers: Threads used to read files concurrently
+          (default: ThreadPoolExecutor default)
+        - engine: 'pyarrow' scans all CSV files as a single Arrow dataset;
+          requires pyarrow (default: per-file pandas reads)
 
     Example:
         >>> config = {'path': 'data/input/daily/', 'pattern': '*.csv'}
@@ -73,44 +124,118 @@ class FolderReader(DataReader):
 
         # Read and combine all files
         dataframes: List[pd.DataFrame] = []
+        files = sorted(files)
+        files_read = 0
+
+        if self.source_config.get('engine') == 'pyarrow':
+            csv_files = [f for f in files if f.suffix.lower() in ['.csv', '.txt']]
+            if csv_files:
+                arrow_df = self._read_csv_dataset(csv_files)
+                if arrow_df is not None:
+                    dataframes.append(arrow_df)
+                    files_read += len(csv_files)
+                    files = [f for f in files if f not in csv_files]
+
+        # Read remaining files concurrently; results keep sorted file order
+        if len(files) > 1:
+            max_workers = self.source_config.get('max_workers')
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(
+                    lambda file_path: _read_one(file_path, self.source_config),
+                    files
+                ))
+        else:
+            results = [_read_one(file_path, self.source_config) for file_path in files]
 
-        for file_path in sorted(files):
-            try:
-                # Determine file type and read accordingly
-                if file_path.suffix.lower() in ['.csv', '.txt']:
-                    file_config = {
-                        'path': str(file_path),
-                        'encoding': self.source_config.get('encoding', 'utf-8'),
-                        'delimiter': self.source_config.get('delimiter', ',')
-                    }
-                    reader = CSVReader(file_config)
-                elif file_path.suffix.lower() in ['.xlsx', '.xls']:
-                    file_config = {
-                        'path': str(file_path),
-                        'sheet_name': self.source_config.get('sheet_name', 0)
-                    }
-                    reader = ExcelReader(file_config)
-                else:
-                    logger.warning(f"Skipping unsupported file type: {file_path}")
-                    continue
-
-                df = reader.read()
-
-                # Add source file column
-                df['_source_file'] = file_path.name
-
-                dataframes.append(df)
-
-            except Exception as e:
-                logger.warning(f"Failed to read file {file_path}: {str(e)}")
-                continue
+        file_frames = [df for df in results if df is not None]
+        dataframes.extend(file_frames)
+        files_read += len(file_frames)
 
         if not dataframes:
             raise ValueError("Failed to read any files from the folder")
 
-        # Combine all dataframes
-        combined_df = pd.concat(dataframes, ignore_index=True)
+        # Combine all dataframes; a single frame (e.g. one Arrow dataset scan,
+        # already concatenated zero-copy as Arrow tables) is used as is
+        if len(dataframes) == 1:
+            combined_df = dataframes[0]
+        else:
+            combined_df = pd.concat(dataframes, ignore_index=True)
 
-        logger.info(f"Successfully combined {len(dataframes)} files into {len(combined_df)} total rows")
+        logger.info(f"Successfully combined {files_read} files into {len(combined_df)} total rows")
 
         return combined_df
+
+    def _read_csv_dataset(self, csv_files: List[Path]) -> Optional[pd.DataFrame]:
+        """
+        Read all CSV files as one Arrow dataset and convert to pandas once.
+
+        Column types are unified across files before scanning, so a column
+        that is integer in one file and float in another is read as float.
+        Unlike pd.read_csv, Arrow parses ISO dates and timestamps while
+        reading, so such columns arrive as dates rather than strings.
+
+        Args:
+            csv_files: Sorted list of CSV file paths
+
+        Returns:
+            Combined DataFrame with a '_source_file' column, or None if
+            pyarrow is unavailable or the files cannot be scanned together
+        """
+        try:
+            import pyarrow.compute as pc
+            import pyarrow.csv as pa_csv
+            import pyarrow.dataset as pa_ds
+            import pyarrow.fs as pa_fs
+        except ImportError:
+            logger.warning("Folder engine 'pyarrow' requested but pyarrow is not installed")
+            return None
+
+        file_format = pa_ds.CsvFileFormat(
+            parse_options=pa_csv.ParseOptions(
+                delimiter=self.source_config.get('delimiter', ',')
+            ),
+            read_options=pa_csv.ReadOptions(
+                encoding=self.source_config.get('encoding', 'utf-8')
+            ),
+            # Empty text fields are missing values, as with pd.read_csv
+            convert_options=pa_csv.ConvertOptions(strings_can_be_null=True)
+        )
+        paths = [str(file_path) for file_path in csv_files]
+
+        try:
+            # One factory inspects every file for the unified schema, and the
+            # whole dataset is then scanned by a single to_table() call
+            factory = pa_ds.FileSystemDatasetFactory(
+                pa_fs.LocalFileSystem(), paths, file_format,
+                pa_ds.FileSystemFactoryOptions()
+            )
+            schema = factory.inspect(promote_options='permissive', fragments=None)
+            dataset = factory.finish(schema)
+
+            # pd.concat of per-file frames puts '_source_file' after the
+            # first file's columns and before columns only later files have
+            first_columns = factory.inspect(fragments=1).names
+            columns = [
+                *first_columns, '_source_file',
+                *(name for name in schema.names if name not in first_columns)
+            ]
+
+            # The scanner's '__filename' field is each row's full file path;
+            # keep only the file name
+            table = dataset.to_table(columns=[*schema.names, '__filename'])
+            source_index = table.schema.get_field_index('__filename')
+            table = table.set_column(
+                source_index, '_source_file',
+                pc.replace_substring_regex(
+                    table.column(source_index), pattern=r'^.*[/\\]', replacement=''
+                )
+            )
+
+            combined = table.select(columns).to_pandas()
+
+        except Exception as e:
+            logger.warning(f"Arrow dataset scan failed, reading CSV files individually: {str(e)}")
+            return None
+
+        logger.info(f"Read {len(csv_files)} CSV files as one Arrow dataset ({len(combined)} rows)")
+        return combined
@@ -0,0 +1,74 @@
+"""
+Parquet file reader for the activity reporting system.
+
+Reads data from Parquet files, skipping text parsing entirely.
+"""
+
+import pandas as pd
+from pathlib import Path
+from typing import Dict, Any
+from .base import DataReader
+from ..utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class ParquetReader(DataReader):
+    """
+    Read data from Parquet files.
+
+    Requires pyarrow.
+
+    Configuration parameters:
+        - path: Path to Parquet file (required)
+        - columns: Only read these columns (default: all columns)
+        - arrow_dtypes: Keep columns as Arrow-backed pandas dtypes instead
+          of converting to NumPy dtypes (default: False)
+
+    Example:
+        >>> config = {'path': 'data/input/activities.parquet'}
+        >>> reader = ParquetReader(config)
+        >>> df = reader.read()
+    """
+
+    def validate_config(self) -> None:
+        """Validate Parquet reader configuration."""
+        if 'path' not in self.source_config:
+            raise ValueError("Parquet reader requires 'path' in configuration")
+
+    def read(self) -> pd.DataFrame:
+        """
+        Read data from Parquet file.
+
+        Returns:
+            DataFrame containing the Parquet data
+
+        Raises:
+            FileNotFoundError: If Parquet file doesn't exist
+            ImportError: If pyarrow is not installed
+        """
+        file_path = Path(self.source_config['path'])
+
+        if not file_path.exists():
+            raise FileNotFoundError(f"Parquet file not found: {file_path}")
+
+        logger.info(f"Reading Parquet file: {file_path}")
+
+        try:
+            import pyarrow.parquet as pq
+
+            table = pq.read_table(file_path, columns=self.source_config.get('columns'))
+
+            to_pandas_kwargs: Dict[str, Any] = {'self_destruct': True}
+            if self.source_config.get('arrow_dtypes', False):
+                to_pandas_kwargs['types_mapper'] = pd.ArrowDtype
+
+            df = table.to_pandas(**to_pandas_kwargs)
+            del table
+
+            logger.info(f"Successfully read {len(df)} rows from {file_path}")
+            return df
+
+        except Exception as e:
+            logger.error(f"Failed to read Parquet file {file_path}: {str(e)}")
+            raise
@@ -4,22 +4,41 @@ Main orchestration module for the activity reporting system.
 Coordinates data ingestion, cleaning, summarization, and report generation.
 """
 
+import gc
 import sys
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
 from datetime import datetime
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 
 from .utils.config_loader import ConfigLoader
 from .utils.logger import setup_logger
-from .ingestion import CSVReader, ExcelReader, APIReader, FolderReader
+from .ingestion import CSVReader, ExcelReader, APIReader, FolderReader, ParquetReader
 from .cleaning import DataCleaner
 from .aggregation import DataSummarizer
-from .reporting import ExcelReportGenerator, PDFReportGenerator
 from .notification import EmailSender, SlackSender
 
+if TYPE_CHECKING:
+    from .reporting import ExcelReportGenerator, PDFReportGenerator
+
 logger = setup_logger(__name__)
 
+# Upper bound on data sources read at the same time
+MAX_INGEST_WORKERS = 8
+
+# Frames at least this many rows long trigger a gc.collect() once dropped
+GC_ROW_THRESHOLD = 1_000_000
+
+# Reader class for each data source 'type'; extend to add new source types
+READER_REGISTRY = {
+    'csv': CSVReader,
+    'excel': ExcelReader,
+    'api': APIReader,
+    'folder': FolderReader,
+    'parquet': ParquetReader
+}
+
 
 class ActivityReporter:
     """
@@ -48,14 +67,24 @@ class ActivityReporter:
         self.config = config
         self.cleaner = DataCleaner()
         self.summarizer = DataSummarizer()
-        self.excel_generator = ExcelReportGenerator()
-        self.pdf_generator = PDFReportGenerator()
+        # Generators (and openpyxl/ReportLab) are loaded on first use, so a
+        # run with one report type disabled never imports its library
+        self._excel_generator: Optional['ExcelReportGenerator'] = None
+        self._pdf_generator: Optional['PDFReportGenerator'] = None
+
+        # Delivery settings read on every run (and on failure paths),
+        # resolved once here
+        self._email_enabled = bool(self.config.get('email.enabled', False))
+        self._slack_enabled = bool(self.config.get('slack.enabled', False))
+        self._email_recipients = list(self.config.get('email.recipients', []) or [])
+        self._slack_channel = self.config.get('slack.channel')
+        self._output_directory = self.config.compile('output.directory', 'data/output')
 
         # Initialize notifiers if configured
         self.email_sender = None
         self.slack_sender = None
 
-        if self.config.get('email.enabled', False):
+        if self._email_enabled:
             try:
                 email_config = {
                     'smtp_host': self.config.get_env('REPORTPILOT_SMTP_HOST'),
@@ -69,7 +98,7 @@ class ActivityReporter:
             except Exception as e:
                 logger.warning(f"Failed to initialize email sender: {str(e)}")
 
-        if self.config.get('slack.enabled', False):
+        if self._slack_enabled:
             try:
                 slack_config = {
                     'bot_token': self.config.get_env('REPORTPILOT_SLACK_BOT_TOKEN'),
@@ -100,29 +129,43 @@ class ActivityReporter:
             if combined_df is None or combined_df.empty:
                 raise ValueError("No data ingested from sources")
 
-            logger.info(f"Total rows ingested: {len(combined_df)}")
+            logger.info("Total rows ingested: %d", len(combined_df))
 
             # 2. Clean data
             logger.info("Step 2: Data cleaning")
             cleaned_df = self._clean_data(combined_df)
 
-            logger.info(f"Rows after cleaning: {len(cleaned_df)}")
+            logger.info("Rows after cleaning: %d", len(cleaned_df))
+
+            # The raw frame is not needed past cleaning; free it before
+            # summarizing instead of holding both until run() returns
+            ingested_rows = len(combined_df)
+            del combined_df
+            if ingested_rows >= GC_ROW_THRESHOLD:
+                gc.collect()
 
             # 3. Summarize data
             logger.info("Step 3: Data summarization")
             summaries = self._summarize_data(cleaned_df)
 
-            logger.info(f"Generated {len(summaries)} summary reports")
+            logger.info("Generated %d summary reports", len(summaries))
 
-            # 4. Generate reports
+            cleaned_rows = len(cleaned_df)
+            del cleaned_df
+            if cleaned_rows >= GC_ROW_THRESHOLD:
+                gc.collect()
+
+            # 4. Generate reports; file names and the email subject share
+            # one timestamp so they cannot disagree across midnight
             logger.info("Step 4: Report generation")
-            report_files = self._generate_reports(summaries)
+            report_time = datetime.now()
+            report_files = self._generate_reports(summaries, report_time)
 
-            logger.info(f"Generated {len(report_files)} report files")
+            logger.info("Generated %d report files", len(report_files))
 
             # 5. Deliver reports
             logger.info("Step 5: Report delivery")
-            self._deliver_reports(report_files, summaries)
+            self._deliver_reports(report_files, summaries, report_time)
 
             logger.info("=" * 60)
             logger.info("Activity report generation completed successfully")
@@ -131,14 +174,20 @@ class ActivityReporter:
             return True
 
         except Exception as e:
+            error_details = traceback.format_exc()
             logger.error(f"Report generation failed: {str(e)}")
-            logger.error(traceback.format_exc())
+            logger.error(error_details)
 
             # Send error notifications
-            self._send_error_notifications(str(e), traceback.format_exc())
+            self._send_error_notifications(str(e), error_details)
 
             return False
 
+        finally:
+            # Do not hold an idle SMTP connection between scheduled runs
+            if self.email_sender:
+                self.email_sender.close()
+
     def _ingest_data(self):
         """Ingest data from all configured sources."""
         data_sources = self.config.get('data_sources', [])
@@ -146,54 +195,102 @@ class ActivityReporter:
         if not data_sources:
             raise ValueError("No data sources configured")
 
-        dataframes = []
+        enabled_sources = []
 
         for source_config in data_sources:
-            source_type = source_config.get('type')
-            enabled = source_config.get('enabled', True)
-
-            if not enabled:
-                logger.info(f"Skipping disabled source: {source_type}")
+            if not source_config.get('enabled', True):
+                logger.info("Skipping disabled source: %s", source_config.get('type'))
                 continue
+            enabled_sources.append(source_config)
 
-            try:
-                # Create appropriate reader
-                if source_type == 'csv':
-                    reader = CSVReader(source_config)
-                elif source_type == 'excel':
-                    reader = ExcelReader(source_config)
-                elif source_type == 'api':
-                    reader = APIReader(source_config)
-                elif source_type == 'folder':
-                    reader = FolderReader(source_config)
-                else:
-                    logger.warning(f"Unknown source type: {source_type}")
-                    continue
-
-                # Read data
-                df = reader.read()
-                dataframes.append(df)
-
-                logger.info(
-                    f"Loaded {len(df)} rows from {source_type} source"
-                )
+        if not enabled_sources:
+            return None
 
-            except Exception as e:
-                logger.error(f"Failed to read from {source_type} source: {str(e)}")
+        dataframes = []
+
+        # Sources are independent and I/O-bound, so read them concurrently;
+        # results are collected in configuration order
+        max_workers = min(MAX_INGEST_WORKERS, len(enabled_sources))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                (source_config, executor.submit(self._read_source, source_config))
+                for source_config in enabled_sources
+            ]
+
+            for source_config, future in futures:
+                source_type = source_config.get('type')
+
+                try:
+                    df = future.result()
+                    if df is None:
+                        continue
+
+                    dataframes.append(df)
+
+                    logger.info("Loaded %d rows from %s source", len(df), source_type)
+
+                except Exception as e:
+                    logger.error(f"Failed to read from {source_type} source: {str(e)}")
 
-                # Check if source is required
-                if source_config.get('required', False):
-                    raise
+                    # Check if source is required
+                    if source_config.get('required', False):
+                        raise
 
         if not dataframes:
             return None
 
+        # A single source needs no combining (and no copy)
+        if len(dataframes) == 1:
+            return dataframes[0]
+
         # Combine all dataframes
         import pandas as pd
-        combined_df = pd.concat(dataframes, ignore_index=True)
+        combined_df = pd.concat(dataframes, ignore_index=True, sort=False)
 
         return combined_df
 
+    def _read_source(self, source_config: Dict[str, Any]):
+        """Read one data source, returning None for unknown source types."""
+        source_type = source_config.get('type')
+
+        # A CSV source with an up-to-date Parquet copy is read from the copy
+        if source_type == 'csv' and source_config.get('prefer_parquet', False):
+            parquet_config = self._parquet_sibling(source_config)
+            if parquet_config is not None:
+                source_type, source_config = 'parquet', parquet_config
+
+        # Create appropriate reader
+        reader_class = READER_REGISTRY.get(source_type)
+        if reader_class is None:
+            logger.warning(f"Unknown source type: {source_type}")
+            return None
+
+        reader = reader_class(source_config)
+
+        # Read data
+        return reader.read()
+
+    def _parquet_sibling(self, source_config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Return a Parquet source config standing in for a CSV source.
+
+        Uses 'parquet_path' if configured, otherwise the CSV path with a
+        .parquet suffix. The Parquet file is only used if it exists and is
+        not older than the CSV file.
+        """
+        csv_path = Path(source_config['path'])
+        parquet_path = Path(source_config.get('parquet_path') or csv_path.with_suffix('.parquet'))
+
+        if not parquet_path.exists():
+            return None
+
+        if csv_path.exists() and parquet_path.stat().st_mtime < csv_path.stat().st_mtime:
+            logger.info("Parquet copy %s is older than %s, reading CSV", parquet_path, csv_path)
+            return None
+
+        logger.info("Reading Parquet copy %s instead of %s", parquet_path, csv_path)
+        return {**source_config, 'type': 'parquet', 'path': str(parquet_path)}
+
     def _clean_data(self, df):
         """Clean and validate data."""
         cleaning_config = self.config.get('cleaning', {})
@@ -201,7 +298,7 @@ class ActivityReporter:
 
         # Log cleaning statistics
         stats = self.cleaner.get_cleaning_stats()
-        logger.info(f"Cleaning stats: {stats}")
+        logger.info("Cleaning stats: %s", stats)
 
         return cleaned_df
 
@@ -212,53 +309,98 @@ class ActivityReporter:
 
         return summaries
 
-    def _generate_reports(self, summaries) -> List[str]:
+    @property
+    def excel_generator(self) -> 'ExcelReportGenerator':
+        """Excel report generator, created on first use."""
+        if self._excel_generator is None:
+            from .reporting import ExcelReportGenerator
+            self._excel_generator = ExcelReportGenerator()
+        return self._excel_generator
+
+    @property
+    def pdf_generator(self) -> 'PDFReportGenerator':
+        """PDF report generator, created on first use."""
+        if self._pdf_generator is None:
+            from .reporting import PDFReportGenerator
+            self._pdf_generator = PDFReportGenerator()
+        return self._pdf_generator
+
+    def _generate_reports(
+        self,
+        summaries,
+        report_time: Optional[datetime] = None
+    ) -> List[str]:
         """Generate Excel and PDF reports."""
-        output_dir = Path(self.config.get('output.directory', 'data/output'))
+        output_dir = Path(self._output_directory())
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        timestamp = (report_time or datetime.now()).strftime('%Y%m%d_%H%M%S')
         report_files = []
 
-        report_config = self.config.get('reports', {})
+        report_config = self.config.get('reports', {}) or {}
+        excel_config = report_config.get('excel', {}) or {}
+        pdf_config = report_config.get('pdf', {}) or {}
+
+        jobs = []
 
         # Generate Excel report
-        if self.config.get('reports.excel.enabled', True):
+        if excel_config.get('enabled', True):
             excel_path = output_dir / f"activity_report_{timestamp}.xlsx"
-            self.excel_generator.generate(
-                summaries,
-                str(excel_path),
-                report_config.get('excel', {})
-            )
-            report_files.append(str(excel_path))
-            logger.info(f"Excel report: {excel_path}")
+            jobs.append(('Excel', self.excel_generator, excel_path, excel_config))
 
         # Generate PDF report
-        if self.config.get('reports.pdf.enabled', True):
+        if pdf_config.get('enabled', True):
             pdf_path = output_dir / f"activity_report_{timestamp}.pdf"
-            self.pdf_generator.generate(
-                summaries,
-                str(pdf_path),
-                report_config.get('pdf', {})
-            )
-            report_files.append(str(pdf_path))
-            logger.info(f"PDF report: {pdf_path}")
+            jobs.append(('PDF', self.pdf_generator, pdf_path, pdf_config))
+
+        # The two reports only read the summaries, so build them concurrently
+        # unless disabled; files are listed in the order above either way
+        if len(jobs) > 1 and report_config.get('parallel', True):
+            with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+                futures = [
+                    (label, path, executor.submit(generator.generate, summaries, str(path), config))
+                    for label, generator, path, config in jobs
+                ]
+                for label, path, future in futures:
+                    future.result()
+                    report_files.append(str(path))
+                    logger.info("%s report: %s", label, path)
+        else:
+            for label, generator, path, config in jobs:
+                generator.generate(summaries, str(path), config)
+                report_files.append(str(path))
+                logger.info("%s report: %s", label, path)
 
         return report_files
 
-    def _deliver_reports(self, report_files: List[str], summaries: Dict):
+    def _has_delivery_channel(self) -> bool:
+        """Return True if email or Slack delivery would send anything."""
+        email_active = bool(self.email_sender and self._email_enabled and self._email_recipients)
+        slack_active = bool(self.slack_sender and self._slack_enabled)
+        return email_active or slack_active
+
+    def _deliver_reports(
+        self,
+        report_files: List[str],
+        summaries: Dict,
+        report_time: Optional[datetime] = None
+    ):
         """Deliver reports via email and Slack."""
+        if not self._has_delivery_channel():
+            logger.info("No delivery channel enabled, skipping report delivery")
+            return
+
         # Generate summary text
         summary_text = self.summarizer.export_summary_text(summaries)
 
         # Email delivery
-        if self.email_sender and self.config.get('email.enabled', False):
+        if self.email_sender and self._email_enabled:
             try:
-                recipients = self.config.get('email.recipients', [])
+                recipients = self._email_recipients
                 if recipients:
                     subject = self.config.get(
                         'email.subject',
-                        f"Weekly Activity Report - {datetime.now().strftime('%Y-%m-%d')}"
+                        f"Weekly Activity Report - {(report_time or datetime.now()).strftime('%Y-%m-%d')}"
                     )
 
                     self.email_sender.send_report(
@@ -267,14 +409,14 @@ class ActivityReporter:
                         body=summary_text,
                         attachments=report_files
                     )
-                    logger.info(f"Reports emailed to {len(recipients)} recipients")
+                    logger.info("Reports emailed to %d recipients", len(recipients))
             except Exception as e:
                 logger.error(f"Email delivery failed: {str(e)}")
 
         # Slack delivery
-        if self.slack_sender and self.config.get('slack.enabled', False):
+        if self.slack_sender and self._slack_enabled:
             try:
-                channel = self.config.get('slack.channel')
+                channel = self._slack_channel
                 self.slack_sender.send_success_notification(
                     channel=channel,
                     summary=summary_text,
@@ -286,10 +428,13 @@ class ActivityReporter:
 
     def _send_error_notifications(self, error_message: str, error_details: str):
         """Send error notifications via configured channels."""
+        if not self._has_delivery_channel():
+            return
+
         # Email notification
-        if self.email_sender and self.config.get('email.enabled', False):
+        if self.email_sender and self._email_enabled:
             try:
-                recipients = self.config.get('email.recipients', [])
+                recipients = self._email_recipients
                 if recipients:
                     self.email_sender.send_error_notification(
                         to=recipients,
@@ -300,9 +445,9 @@ class ActivityReporter:
                 logger.error(f"Failed to send email error notification: {str(e)}")
 
         # Slack notification
-        if self.slack_sender and self.config.get('slack.enabled', False):
+        if self.slack_sender and self._slack_enabled:
             try:
-                channel = self.config.get('slack.channel')
+                channel = self._slack_channel
                 self.slack_sender.send_error_notification(
                     error_message=error_message,
                     channel=channel,
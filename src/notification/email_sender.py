@@ -4,10 +4,10 @@ Email sender for the activity reporting system.
 Sends reports via SMTP with attachment support.
 """
 
+import mimetypes
 import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.application import MIMEApplication
+import threading
+from email.message import EmailMessage
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from ..utils.logger import setup_logger
@@ -25,6 +25,9 @@ class EmailSender:
     - File attachments
     - TLS/SSL encryption
 
+    The SMTP connection is reused across messages until close() is
+    called; the sender can also be used as a context manager.
+
     Example:
         >>> sender = EmailSender(config)
         >>> sender.send_report(
@@ -56,6 +59,12 @@ class EmailSender:
         self.config = config
         self._validate_config()
 
+        self._from_header = self.config['from_email']
+
+        # SMTP connection shared by consecutive sends; see close()
+        self._server: Optional[smtplib.SMTP] = None
+        self._lock = threading.Lock()
+
     def _validate_config(self) -> None:
         """Validate email configuration."""
         required_keys = ['smtp_host', 'smtp_port', 'from_email', 'password']
@@ -90,9 +99,10 @@ class EmailSender:
             True if email sent successfully, False otherwise
         """
         try:
-            # Create message
-            msg = MIMEMultipart()
-            msg['From'] = self.config['from_email']
+            # Create message; EmailMessage becomes multipart/mixed once the
+            # first attachment is added
+            msg = EmailMessage()
+            msg['From'] = self._from_header
             msg['To'] = ', '.join(to)
             msg['Subject'] = subject
 
@@ -100,8 +110,7 @@ class EmailSender:
                 msg['Cc'] = ', '.join(cc)
 
             # Add body
-            body_type = 'html' if html else 'plain'
-            msg.attach(MIMEText(body, body_type))
+            msg.set_content(body, subtype='html' if html else 'plain')
 
             # Add attachments
             if attachments:
@@ -109,39 +118,75 @@ class EmailSender:
                     self._attach_file(msg, file_path)
 
             # Combine all recipients
-            all_recipients = to.copy()
-            if cc:
-                all_recipients.extend(cc)
-            if bcc:
-                all_recipients.extend(bcc)
+            all_recipients = [*to, *(cc or ()), *(bcc or ())]
 
             # Send email
             self._send_smtp(msg, all_recipients)
 
-            logger.info(f"Email sent successfully to {len(all_recipients)} recipients")
+            logger.info("Email sent successfully to %d recipients", len(all_recipients))
             return True
 
         except Exception as e:
             logger.error(f"Failed to send email: {str(e)}")
             return False
 
-    def _attach_file(self, msg: MIMEMultipart, file_path: str) -> None:
+    def _attach_file(self, msg: EmailMessage, file_path: str) -> None:
         """Attach a file to the email message."""
         path = Path(file_path)
 
-        if not path.exists():
+        # One stat() both checks existence and gives the size for logging
+        try:
+            size = path.stat().st_size
+        except FileNotFoundError:
             logger.warning(f"Attachment file not found: {file_path}")
             return
 
-        with open(path, 'rb') as f:
-            attachment = MIMEApplication(f.read(), Name=path.name)
-            attachment['Content-Disposition'] = f'attachment; filename="{path.name}"'
-            msg.attach(attachment)
+        # Give Excel/PDF reports their real content type instead of
+        # application/octet-stream
+        mime_type, encoding = mimetypes.guess_type(path.name)
+        if mime_type is None or encoding is not None:
+            mime_type = 'application/octet-stream'
+        maintype, subtype = mime_type.split('/', 1)
+
+        # The raw bytes are released as soon as they are base64-encoded
+        msg.add_attachment(
+            path.read_bytes(),
+            maintype=maintype,
+            subtype=subtype,
+            filename=path.name
+        )
 
-        logger.info(f"Attached file: {path.name}")
+        logger.info("Attached file: %s (%d bytes)", path.name, size)
 
-    def _send_smtp(self, msg: MIMEMultipart, recipients: List[str]) -> None:
-        """Send email via SMTP."""
+    def _send_smtp(self, msg: EmailMessage, recipients: List[str]) -> None:
+        """
+        Send email via SMTP.
+
+        The connection is opened on first use and kept for later messages,
+        so TLS and login happen once per session. A connection the server
+        has dropped is reopened once before giving up.
+        """
+        with self._lock:
+            for attempt in range(2):
+                if self._server is None:
+                    self._server = self._connect()
+
+                try:
+                    # Send email (explicit recipients so BCC addresses are included)
+                    self._server.send_message(msg, to_addrs=recipients)
+                    break
+                except smtplib.SMTPServerDisconnected:
+                    # Release the dropped connection's socket before reopening
+                    self._server.close()
+                    self._server = None
+                    if attempt:
+                        raise
+                    logger.info("SMTP connection was closed by the server, reconnecting")
+
+        logger.info("Email sent via SMTP: %s:%s", self.config['smtp_host'], self.config['smtp_port'])
+
+    def _connect(self) -> smtplib.SMTP:
+        """Open an authenticated SMTP connection."""
         smtp_host = self.config['smtp_host']
         smtp_port = int(self.config['smtp_port'])
         username = self.config.get('username', self.config['from_email'])
@@ -162,13 +207,30 @@ class EmailSender:
             # Login
             server.login(username, password)
 
-            # Send email
-            server.send_message(msg)
+        except Exception:
+            server.close()
+            raise
+
+        return server
+
+    def close(self) -> None:
+        """Close the SMTP connection if one is open."""
+        with self._lock:
+            if self._server is None:
+                return
+
+            try:
+                self._server.quit()
+            except smtplib.SMTPException:
+                self._server.close()
+            finally:
+                self._server = None
 
-            logger.info(f"Email sent via SMTP: {smtp_host}:{smtp_port}")
+    def __enter__(self) -> 'EmailSender':
+        return self
 
-        finally:
-            server.quit()
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
     def send_error_notification(
         self,
@@ -4,13 +4,35 @@ Slack sender for the activity reporting system.
 Sends messages and uploads files to Slack channels.
 """
 
+import os
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from ..utils.logger import setup_logger
 
+try:
+    from requests_toolbelt import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
 logger = setup_logger(__name__)
 
+# Retry policy for POSTs that Slack cannot have processed: connection
+# failures before the request is sent, and 429 rate limits, which wait for
+# Retry-After. Read errors and 5xx responses are not retried since the
+# message may already have been posted.
+RETRY_TOTAL = 3
+RETRY_BACKOFF_FACTOR = 0.3
+RETRY_STATUS_CODES = [429]
+
+# Concurrent file uploads; must not exceed the session's pool_maxsize
+MAX_UPLOAD_WORKERS = 4
+
+FILES_UPLOAD_URL = 'https://slack.com/api/files.upload'
+
 
 class SlackSender:
     """
@@ -53,6 +75,41 @@ class SlackSender:
         self.webhook_url = config.get('webhook_url')
         self.default_channel = config.get('default_channel')
 
+        # Pooled keep-alive session so the message and every file upload
+        # share one TLS connection to Slack
+        retry = Retry(
+            total=RETRY_TOTAL,
+            connect=RETRY_TOTAL,
+            read=0,
+            other=0,
+            status=RETRY_TOTAL,
+            backoff_factor=RETRY_BACKOFF_FACTOR,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset({'POST'}),
+            respect_retry_after_header=True
+        )
+        self._session = requests.Session()
+        self._session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=retry
+        ))
+        if MultipartEncoder is not None:
+            self._session.mount(FILES_UPLOAD_URL, HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=MAX_UPLOAD_WORKERS,
+                max_retries=0
+            ))
+
+        # Built once; only sent to the Web API, never to the webhook URL
+        self._auth_headers = (
+            {'Authorization': f'Bearer {self.bot_token}'} if self.bot_token else {}
+        )
+
+        # Delivery method is fixed by configuration: the webhook wins when set
+        self._send_fn = self._send_webhook if self.webhook_url else self._send_message
+        self._supports_uploads = bool(self.bot_token)
+
     def _validate_config(self) -> None:
         """Validate Slack configuration."""
         if 'bot_token' not in self.config and 'webhook_url' not in self.config:
@@ -87,34 +144,46 @@ class SlackSender:
 
         try:
             # Send message
-            if self.webhook_url:
-                success = self._send_webhook(message)
-            else:
-                success = self._send_message(message, target_channel, thread_ts)
+            success = self._send_fn(message, target_channel, thread_ts)
 
             if not success:
                 return False
 
-            # Upload files if provided
-            if files and self.bot_token:
-                for file_path in files:
-                    self._upload_file(file_path, target_channel, message)
-
-            logger.info(f"Slack notification sent to {target_channel or 'webhook'}")
+            # Upload files if provided; uploads are independent and
+            # network-bound, so they run concurrently on the pooled session
+            if files and self._supports_uploads:
+                workers = min(MAX_UPLOAD_WORKERS, len(files))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    list(executor.map(
+                        lambda file_path: self._upload_file(file_path, target_channel, message),
+                        files
+                    ))
+
+            logger.info("Slack notification sent to %s", target_channel or 'webhook')
             return True
 
         except Exception as e:
             logger.error(f"Failed to send Slack notification: {str(e)}")
             return False
 
-    def _send_webhook(self, message: str) -> bool:
-        """Send message via webhook URL."""
+    def _send_webhook(
+        self,
+        message: str,
+        channel: Optional[str] = None,
+        thread_ts: Optional[str] = None
+    ) -> bool:
+        """
+        Send message via webhook URL.
+
+        The channel and thread are fixed by the webhook; the arguments are
+        accepted so both send methods share one signature.
+        """
         payload = {
             'text': message,
             'mrkdwn': True
         }
 
-        response = requests.post(
+        response = self._session.post(
             self.webhook_url,
             json=payload,
             timeout=10
@@ -136,11 +205,6 @@ class SlackSender:
         """Send message via Slack API."""
         url = 'https://slack.com/api/chat.postMessage'
 
-        headers = {
-            'Authorization': f'Bearer {self.bot_token}',
-            'Content-Type': 'application/json'
-        }
-
         payload = {
             'channel': channel,
             'text': message,
@@ -150,9 +214,9 @@ class SlackSender:
         if thread_ts:
             payload['thread_ts'] = thread_ts
 
-        response = requests.post(
+        response = self._session.post(
             url,
-            headers=headers,
+            headers=self._auth_headers,
             json=payload,
             timeout=10
         )
@@ -160,7 +224,7 @@ class SlackSender:
         result = response.json()
 
         if result.get('ok'):
-            logger.info(f"Message sent to Slack channel: {channel}")
+            logger.info("Message sent to Slack channel: %s", channel)
             return True
         else:
             error = result.get('error', 'Unknown error')
@@ -176,15 +240,15 @@ class SlackSender:
         """Upload file to Slack channel."""
         path = Path(file_path)
 
-        if not path.exists():
+        # Opening the file is the existence check; fstat gives the size
+        # without a second lookup by path
+        try:
+            f = open(path, 'rb')
+        except FileNotFoundError:
             logger.warning(f"File not found for upload: {file_path}")
             return False
 
-        url = 'https://slack.com/api/files.upload'
-
-        headers = {
-            'Authorization': f'Bearer {self.bot_token}'
-        }
+        url = FILES_UPLOAD_URL
 
         data = {
             'channels': channel,
@@ -194,21 +258,38 @@ class SlackSender:
         if comment:
             data['initial_comment'] = comment
 
-        with open(path, 'rb') as f:
-            files = {'file': f}
+        with f:
+            size = os.fstat(f.fileno()).st_size
+
+            if MultipartEncoder is not None:
+                # Stream the multipart body from disk instead of building it
+                # in memory; the upload URL is mounted without retries since
+                # a consumed stream cannot be resent
+                encoder = MultipartEncoder(fields={
+                    **data,
+                    'file': (path.name, f, 'application/octet-stream')
+                })
+                response = self._session.post(
+                    url,
+                    headers={**self._auth_headers, 'Content-Type': encoder.content_type},
+                    data=encoder,
+                    timeout=30
+                )
+            else:
+                files = {'file': f}
 
-            response = requests.post(
-                url,
-                headers=headers,
-                data=data,
-                files=files,
-                timeout=30
-            )
+                response = self._session.post(
+                    url,
+                    headers=self._auth_headers,
+                    data=data,
+                    files=files,
+                    timeout=30
+                )
 
         result = response.json()
 
         if result.get('ok'):
-            logger.info(f"File uploaded to Slack: {path.name}")
+            logger.info("File uploaded to Slack: %s (%d bytes)", path.name, size)
             return True
         else:
             error = result.get('error', 'Unknown error')
@@ -1,6 +1,27 @@
-"""Report generation modules for Excel and PDF outputs."""
+"""
+Report generation modules for Excel and PDF outputs.
 
-from .excel_generator import ExcelReportGenerator
-from .pdf_generator import PDFReportGenerator
+Generators are imported on first access, so using one report type does not
+import the other's library (openpyxl or ReportLab).
+"""
+
+import importlib
+from typing import Any
+
+# Public name -> submodule that defines it
+_GENERATOR_MODULES = {
+    'ExcelReportGenerator': '.excel_generator',
+    'PDFReportGenerator': '.pdf_generator',
+}
 
 __all__ = ['ExcelReportGenerator', 'PDFReportGenerator']
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _GENERATOR_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -4,18 +4,23 @@ Excel report generator for the activity reporting system.
 Creates formatted Excel reports with multiple sheets, charts, and styling.
 """
 
+import numpy as np
 import pandas as pd
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.chart import BarChart, LineChart, Reference
-from openpyxl.utils.dataframe import dataframe_to_rows
+from openpyxl.utils import get_column_letter
 from ..utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Fixed column widths of the overview sheet
+SUMMARY_COLUMN_WIDTHS = {'A': 25, 'B': 30, 'C': 20, 'D': 20}
+
 
 class ExcelReportGenerator:
     """
@@ -43,6 +48,20 @@ class ExcelReportGenerator:
             'negative': 'FFFFC7CE'
         }
 
+        # Styles shared by every data sheet cell; openpyxl style objects are
+        # immutable, so one instance can be assigned to any number of cells
+        self._header_font = Font(bold=True, color='FFFFFF')
+        self._header_fill = PatternFill(start_color=self.colors['header'],
+                                        end_color=self.colors['header'],
+                                        fill_type='solid')
+        self._header_alignment = Alignment(horizontal='center')
+        self._thin_border = Border(
+            left=Side(style='thin'),
+            right=Side(style='thin'),
+            top=Side(style='thin'),
+            bottom=Side(style='thin')
+        )
+
     def generate(
         self,
         summaries: Dict[str, pd.DataFrame],
@@ -64,6 +83,9 @@ class ExcelReportGenerator:
             - title: Report title (default: 'Weekly Activity Report')
             - include_charts: Add charts to report (default: True)
             - freeze_panes: Freeze header rows (default: True)
+            - engine: 'pyexcelerate' writes the workbook with PyExcelerate,
+              which is much faster for large sheets but adds no charts;
+              requires pyexcelerate (default: openpyxl)
         """
         if config is None:
             config = {}
@@ -74,9 +96,14 @@ class ExcelReportGenerator:
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        # Create workbook
-        wb = Workbook()
-        wb.remove(wb.active)  # Remove default sheet
+        if config.get('engine') == 'pyexcelerate':
+            if self._generate_pyexcelerate(summaries, output_path, config):
+                logger.info(f"Excel report generated successfully: {output_path}")
+                return output_path
+
+        # Create workbook; write-only sheets stream rows to disk instead of
+        # keeping every cell object in memory until save
+        wb = Workbook(write_only=True)
 
         # Add summary sheet
         self._add_summary_sheet(wb, summaries, config)
@@ -105,52 +132,72 @@ class ExcelReportGenerator:
         """Add overview summary sheet."""
         ws = wb.create_sheet('Summary', 0)
 
-        # Add title
-        title = config.get('title', 'Weekly Activity Report')
-        ws['A1'] = title
-        ws['A1'].font = Font(size=16, bold=True, color='FFFFFF')
-        ws['A1'].fill = PatternFill(start_color=self.colors['header'],
-                                     end_color=self.colors['header'],
-                                     fill_type='solid')
-        ws['A1'].alignment = Alignment(horizontal='center')
-        ws.merge_cells('A1:D1')
+        # Adjust column widths (write-only sheets need these before any rows)
+        for column_letter, width in SUMMARY_COLUMN_WIDTHS.items():
+            ws.column_dimensions[column_letter].width = width
+
+        for style, values in self._summary_rows(summaries, config):
+            if style:
+                first = WriteOnlyCell(ws, value=values[0])
+                self._style_summary_cell(first, style)
+                values = [first, *values[1:]]
+            ws.append(values)
 
-        # Add generation date
-        ws['A2'] = f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        ws['A2'].font = Font(italic=True)
+        ws.merged_cells.add('A1:D1')
 
-        row = 4
+    def _summary_rows(
+        self,
+        summaries: Dict[str, pd.DataFrame],
+        config: Dict[str, Any]
+    ) -> List[Tuple[Optional[str], List[Any]]]:
+        """
+        Build the summary sheet contents.
 
-        # Add summary information
-        ws[f'A{row}'] = "Report Contents:"
-        ws[f'A{row}'].font = Font(bold=True, size=12)
-        row += 1
+        Returns:
+            One (style, values) pair per row; style names how the first
+            cell is formatted ('title', 'note', 'heading' or None)
+        """
+        rows: List[Tuple[Optional[str], List[Any]]] = [
+            # Add title
+            ('title', [config.get('title', 'Weekly Activity Report')]),
+            # Add generation date
+            ('note', [f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"]),
+            (None, []),
+            # Add summary information
+            ('heading', ["Report Contents:"])
+        ]
 
         for sheet_name, df in summaries.items():
             if isinstance(df, pd.DataFrame):
-                ws[f'B{row}'] = f"• {sheet_name.replace('_', ' ').title()}"
-                ws[f'C{row}'] = f"{len(df)} rows"
-                row += 1
+                rows.append((None, [
+                    None,
+                    f"• {sheet_name.replace('_', ' ').title()}",
+                    f"{len(df)} rows"
+                ]))
 
         # Add key metrics if available
         if 'weekly_totals' in summaries and not summaries['weekly_totals'].empty:
-            row += 2
-            ws[f'A{row}'] = "Latest Week Summary:"
-            ws[f'A{row}'].font = Font(bold=True, size=12)
-            row += 1
+            rows.append((None, []))
+            rows.append((None, []))
+            rows.append(('heading', ["Latest Week Summary:"]))
 
             latest = summaries['weekly_totals'].iloc[-1]
             for col, value in latest.items():
                 if col not in ['week_start', 'week_number', 'year']:
-                    ws[f'B{row}'] = col.replace('_', ' ').title()
-                    ws[f'C{row}'] = value
-                    row += 1
+                    rows.append((None, [None, col.replace('_', ' ').title(), value]))
+
+        return rows
 
-        # Adjust column widths
-        ws.column_dimensions['A'].width = 25
-        ws.column_dimensions['B'].width = 30
-        ws.column_dimensions['C'].width = 20
-        ws.column_dimensions['D'].width = 20
+    def _style_summary_cell(self, cell: Any, style: str) -> None:
+        """Apply a summary row style to an openpyxl cell."""
+        if style == 'title':
+            cell.font = Font(size=16, bold=True, color='FFFFFF')
+            cell.fill = self._header_fill
+            cell.alignment = self._header_alignment
+        elif style == 'note':
+            cell.font = Font(italic=True)
+        elif style == 'heading':
+            cell.font = Font(bold=True, size=12)
 
     def _add_data_sheet(
         self,
@@ -164,56 +211,188 @@ class ExcelReportGenerator:
         clean_name = sheet_name.replace('_', ' ').title()[:31]
         ws = wb.create_sheet(clean_name)
 
-        # Write DataFrame to sheet
-        for r_idx, row in enumerate(dataframe_to_rows(df, index=False, header=True), 1):
-            for c_idx, value in enumerate(row, 1):
-                cell = ws.cell(row=r_idx, column=c_idx, value=value)
-
-                # Style header row
-                if r_idx == 1:
-                    cell.font = Font(bold=True, color='FFFFFF')
-                    cell.fill = PatternFill(start_color=self.colors['header'],
-                                           end_color=self.colors['header'],
-                                           fill_type='solid')
-                    cell.alignment = Alignment(horizontal='center')
-
-                # Add borders
-                thin_border = Border(
-                    left=Side(style='thin'),
-                    right=Side(style='thin'),
-                    top=Side(style='thin'),
-                    bottom=Side(style='thin')
-                )
-                cell.border = thin_border
-
-                # Format numbers
-                if r_idx > 1 and isinstance(value, (int, float)):
-                    if abs(value) < 1 and value != 0:
-                        cell.number_format = '0.00'
-                    elif abs(value) >= 1000:
-                        cell.number_format = '#,##0'
-                    else:
-                        cell.number_format = '0.00'
-
-        # Auto-adjust column widths
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-
-            for cell in column:
-                try:
-                    if cell.value:
-                        max_length = max(max_length, len(str(cell.value)))
-                except:
-                    pass
-
+        # Write-only sheets take column widths and panes before the first row
+        for c_idx, max_length in enumerate(self._column_text_lengths(df), 1):
             adjusted_width = min(max_length + 2, 50)
-            ws.column_dimensions[column_letter].width = adjusted_width
+            ws.column_dimensions[get_column_letter(c_idx)].width = adjusted_width
 
         # Freeze header row if requested
         if config.get('freeze_panes', True):
             ws.freeze_panes = 'A2'
 
+        # Number formats are decided once per column, not per cell
+        column_formats = self._column_number_formats(df)
+
+        # Header row
+        header = []
+        for col in df.columns:
+            cell = WriteOnlyCell(ws, value=col)
+            cell.font = self._header_font
+            cell.fill = self._header_fill
+            cell.alignment = self._header_alignment
+            cell.border = self._thin_border
+            header.append(cell)
+        ws.append(header)
+
+        # Data rows; values are pulled out a column at a time (keeping each
+        # column's own types) and zipped into rows
+        row_formats = [column_formats.get(c_idx) for c_idx in range(1, len(df.columns) + 1)]
+        column_values = [column.tolist() for _, column in df.items()]
+
+        for row in zip(*column_values):
+            cells = []
+            for value, number_format in zip(row, row_formats):
+                cell = WriteOnlyCell(ws, value=value)
+                cell.border = self._thin_border
+                if number_format:
+                    cell.number_format = number_format
+                cells.append(cell)
+            ws.append(cells)
+
+    def _column_text_lengths(self, df: pd.DataFrame) -> List[int]:
+        """
+        Return the longest text length per column, header included.
+
+        Lengths come from vectorized string operations on each column
+        instead of converting every cell value in Python.
+        """
+        lengths = []
+
+        for col, column in df.items():
+            values = column[column.notna()]
+            data_length = 0
+
+            if not values.empty:
+                if pd.api.types.is_datetime64_any_dtype(values):
+                    # Written as full timestamps, e.g. '2024-01-01 00:00:00'
+                    data_length = len(str(values.max()))
+                else:
+                    data_length = int(values.astype(str).str.len().max())
+
+            lengths.append(max(len(str(col)), data_length))
+
+        return lengths
+
+    def _column_number_formats(self, df: pd.DataFrame) -> Dict[int, str]:
+        """
+        Choose one number format per numeric column.
+
+        Columns of values of 1000 or more get a thousands format, columns
+        of smaller values two decimals, and columns mixing both get a
+        thousands format with two decimals so small values keep their
+        fraction.
+
+        Returns:
+            Mapping of 1-based column index to number format
+        """
+        formats = {}
+
+        for c_idx, (_, column) in enumerate(df.items(), 1):
+            if pd.api.types.is_bool_dtype(column) or not pd.api.types.is_numeric_dtype(column):
+                continue
+
+            magnitudes = column.abs().to_numpy(dtype='float64', na_value=np.nan)
+            magnitudes = magnitudes[~np.isnan(magnitudes)]
+            large = magnitudes >= 1000
+
+            if not large.any():
+                formats[c_idx] = '0.00'
+            elif large.all():
+                formats[c_idx] = '#,##0'
+            else:
+                formats[c_idx] = '#,##0.00'
+
+        return formats
+
+    def _generate_pyexcelerate(
+        self,
+        summaries: Dict[str, pd.DataFrame],
+        output_path: str,
+        config: Dict[str, Any]
+    ) -> bool:
+        """
+        Write the report with PyExcelerate.
+
+        Sheets are written from whole 2D value lists and styled by range,
+        instead of cell by cell. Number formats are chosen per column.
+
+        Returns:
+            True if the workbook was written, False if pyexcelerate is not
+            installed (the caller then uses openpyxl)
+        """
+        try:
+            import pyexcelerate as px
+        except ImportError:
+            logger.warning("Excel engine 'pyexcelerate' requested but pyexcelerate is not installed")
+            return False
+
+        if config.get('include_charts', True):
+            logger.info("Charts are not supported by the pyexcelerate engine and are skipped")
+
+        header_color = px.Color(*bytes.fromhex(self.colors['header'][2:]))
+        white = px.Color(255, 255, 255)
+        thin = px.Border.Border(style='thin')
+        borders = px.Borders.Borders(left=thin, right=thin, top=thin, bottom=thin)
+
+        wb = px.Workbook()
+
+        # Summary sheet
+        summary_rows = self._summary_rows(summaries, config)
+        ws = wb.new_sheet('Summary', data=[values for _, values in summary_rows])
+
+        summary_styles = {
+            'title': px.Style(
+                font=px.Font(size=16, bold=True, color=white),
+                fill=px.Fill(background=header_color),
+                alignment=px.Alignment(horizontal='center')
+            ),
+            'note': px.Style(font=px.Font(italic=True)),
+            'heading': px.Style(font=px.Font(bold=True, size=12))
+        }
+        for r_idx, (style, _) in enumerate(summary_rows, 1):
+            if style:
+                ws.set_cell_style(r_idx, 1, summary_styles[style])
+
+        ws.range('A1', 'D1').merge()
+        for c_idx, width in enumerate(SUMMARY_COLUMN_WIDTHS.values(), 1):
+            ws.set_col_style(c_idx, px.Style(size=width))
+
+        # Data sheets
+        for sheet_name, df in summaries.items():
+            if not isinstance(df, pd.DataFrame) or df.empty:
+                continue
+
+            clean_name = sheet_name.replace('_', ' ').title()[:31]
+            values = df.astype(object).where(df.notna(), None).values.tolist()
+            ws = wb.new_sheet(clean_name, data=[list(df.columns), *values])
+
+            n_rows = len(df) + 1
+            n_cols = len(df.columns)
+
+            ws.range((1, 1), (n_rows, n_cols)).style.borders = borders
+            header = ws.range((1, 1), (1, n_cols))
+            header.style.font = px.Font(bold=True, color=white)
+            header.style.fill = px.Fill(background=header_color)
+            header.style.alignment = px.Alignment(horizontal='center')
+
+            column_formats = self._column_number_formats(df)
+            for c_idx, (_, column) in enumerate(df.items(), 1):
+                if pd.api.types.is_datetime64_any_dtype(column):
+                    column_formats[c_idx] = 'yyyy-mm-dd h:mm:ss'
+
+            for c_idx, number_format in column_formats.items():
+                if n_rows > 1:
+                    ws.range((2, c_idx), (n_rows, c_idx)).style.format = px.Format(number_format)
+
+            for c_idx, max_length in enumerate(self._column_text_lengths(df), 1):
+                ws.set_col_style(c_idx, px.Style(size=min(max_length + 2, 50)))
+
+            if config.get('freeze_panes', True):
+                ws.panes = px.Panes(0, 1)
+
+        wb.save(output_path)
+        return True
+
     def _add_charts(
         self,
         wb: Workbook,
@@ -4,6 +4,7 @@ PDF report generator for the activity reporting system.
 Creates formatted PDF reports with tables, summaries, and formatting.
 """
 
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from typing import Dict, Any, Optional, List
@@ -13,7 +14,7 @@ from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.platypus import (
-    SimpleDocTemplate, Table, TableStyle, Paragraph,
+    SimpleDocTemplate, LongTable, TableStyle, Paragraph,
     Spacer, PageBreak, Image
 )
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
@@ -38,6 +39,26 @@ class PDFReportGenerator:
         >>> generator.generate(summaries, 'reports/weekly_report.pdf')
     """
 
+    # Shared by every section table
+    _TABLE_STYLE = TableStyle([
+        # Header style
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4472c4')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+
+        # Data style
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 1), (-1, -1), 9),
+        ('ALIGN', (0, 1), (-1, -1), 'LEFT'),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1),
+         [colors.white, colors.HexColor('#f0f0f0')]),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ])
+
     def __init__(self):
         """Initialize the PDF report generator."""
         self.styles = getSampleStyleSheet()
@@ -69,6 +90,12 @@ class PDFReportGenerator:
             spaceAfter=6
         ))
 
+        # Style handles used for every section
+        self._s_normal = self.styles['Normal']
+        self._s_section = self.styles['SectionHeader']
+        self._s_sub = self.styles['SubHeader']
+        self._s_title = self.styles['CustomTitle']
+
     def generate(
         self,
         summaries: Dict[str, pd.DataFrame],
@@ -144,12 +171,12 @@ class PDFReportGenerator:
 
         # Add title
         elements.append(Spacer(1, 2*inch))
-        elements.append(Paragraph(title, self.styles['CustomTitle']))
+        elements.append(Paragraph(title, self._s_title))
         elements.append(Spacer(1, 0.5*inch))
 
         # Add date
         date_text = f"Generated: {datetime.now().strftime('%B %d, %Y')}"
-        elements.append(Paragraph(date_text, self.styles['Normal']))
+        elements.append(Paragraph(date_text, self._s_normal))
 
         return elements
 
@@ -160,7 +187,7 @@ class PDFReportGenerator:
         """Create executive summary section."""
         elements = []
 
-        elements.append(Paragraph("Executive Summary", self.styles['SectionHeader']))
+        elements.append(Paragraph("Executive Summary", self._s_section))
         elements.append(Spacer(1, 0.1*inch))
 
         # Add key metrics from weekly totals
@@ -184,32 +211,30 @@ class PDFReportGenerator:
                     label = col.replace('_', ' ').title()
                     summary_text.append(f"• {label}: {formatted_value}")
 
-            elements.append(Paragraph("<br/>".join(summary_text), self.styles['Normal']))
+            elements.append(Paragraph("<br/>".join(summary_text), self._s_normal))
 
         # Add trend information if available
         if 'trends' in summaries and not summaries['trends'].empty:
             elements.append(Spacer(1, 0.2*inch))
-            elements.append(Paragraph("<b>Trends:</b>", self.styles['Normal']))
-
-            trends = summaries['trends'].iloc[-1]
-            trend_text = []
+            elements.append(Paragraph("<b>Trends:</b>", self._s_normal))
 
-            for col in summaries['trends'].columns:
-                if col.endswith('_pct_change'):
-                    base_col = col.replace('_pct_change', '')
-                    pct_value = trends[col]
+            trends_df = summaries['trends']
+            pct_cols = [col for col in trends_df.columns if col.endswith('_pct_change')]
 
-                    if pd.notna(pct_value):
-                        direction = "↑" if pct_value > 0 else ("↓" if pct_value < 0 else "→")
-                        color = "green" if pct_value > 0 else ("red" if pct_value < 0 else "black")
+            # Latest change per metric, classified in one pass
+            pcts = trends_df[pct_cols].iloc[-1].dropna()
+            values = pcts.to_numpy(dtype=float)
+            directions = np.where(values > 0, "↑", np.where(values < 0, "↓", "→"))
+            trend_colors = np.where(values > 0, "green", np.where(values < 0, "red", "black"))
 
-                        trend_text.append(
-                            f'• {base_col.replace("_", " ").title()}: '
-                            f'<font color="{color}">{direction} {pct_value:+.1f}%</font>'
-                        )
+            trend_text = [
+                f'• {col.replace("_pct_change", "").replace("_", " ").title()}: '
+                f'<font color="{color}">{direction} {value:+.1f}%</font>'
+                for col, value, direction, color in zip(pcts.index, values, directions, trend_colors)
+            ]
 
             if trend_text:
-                elements.append(Paragraph("<br/>".join(trend_text), self.styles['Normal']))
+                elements.append(Paragraph("<br/>".join(trend_text), self._s_normal))
 
         return elements
 
@@ -224,58 +249,58 @@ class PDFReportGenerator:
 
         # Add section header
         header_text = section_name.replace('_', ' ').title()
-        elements.append(Paragraph(header_text, self.styles['SectionHeader']))
+        elements.append(Paragraph(header_text, self._s_section))
         elements.append(Spacer(1, 0.1*inch))
 
         # Limit rows if too many
         if len(df) > max_rows:
             df_display = df.head(max_rows)
             note = f"<i>Showing top {max_rows} of {len(df)} rows</i>"
-            elements.append(Paragraph(note, self.styles['Normal']))
+            elements.append(Paragraph(note, self._s_normal))
             elements.append(Spacer(1, 0.05*inch))
         else:
             df_display = df
 
-        # Create table data
+        # Create table data; values are formatted a column at a time by
+        # dtype, then transposed into rows
+        formatted_columns = [
+            self._format_column(column) for _, column in df_display.items()
+        ]
         table_data = [df_display.columns.tolist()]
+        table_data.extend(list(row) for row in zip(*formatted_columns))
 
-        for _, row in df_display.iterrows():
-            formatted_row = []
-            for value in row:
-                # Format values
-                if pd.isna(value):
-                    formatted_row.append('')
-                elif isinstance(value, float):
-                    formatted_row.append(f"{value:.2f}")
-                elif isinstance(value, datetime):
-                    formatted_row.append(value.strftime('%Y-%m-%d'))
-                else:
-                    formatted_row.append(str(value))
-            table_data.append(formatted_row)
-
-        # Create table
-        table = Table(table_data)
-
-        # Apply table style
-        table.setStyle(TableStyle([
-            # Header style
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#4472c4')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-
-            # Data style
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 9),
-            ('ALIGN', (0, 1), (-1, -1), 'LEFT'),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1),
-             [colors.white, colors.HexColor('#f0f0f0')]),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ]))
+        # LongTable lays out long tables faster and repeats the header row
+        # when a table splits across pages
+        table = LongTable(table_data, repeatRows=1)
+        table.setStyle(self._TABLE_STYLE)
 
         elements.append(table)
 
         return elements
+
+    def _format_column(self, column: pd.Series) -> List[str]:
+        """Format one column's values as table cell text."""
+        if pd.api.types.is_datetime64_any_dtype(column):
+            return column.dt.strftime('%Y-%m-%d').fillna('').tolist()
+
+        if pd.api.types.is_float_dtype(column):
+            values = column.to_numpy(dtype='float64', na_value=np.nan)
+            return ['' if value != value else f"{value:.2f}" for value in values]
+
+        if pd.api.types.is_bool_dtype(column) or pd.api.types.is_integer_dtype(column) \
+                or isinstance(column.dtype, pd.StringDtype):
+            # str() of every value is the cell text; convert in one call
+            return column.astype(str).where(column.notna(), '').tolist()
+
+        return [self._format_value(value) for value in column.tolist()]
+
+    def _format_value(self, value: Any) -> str:
+        """Format a single table value of any type."""
+        if pd.isna(value):
+            return ''
+        elif isinstance(value, float):
+            return f"{value:.2f}"
+        elif isinstance(value, datetime):
+            return value.strftime('%Y-%m-%d')
+        else:
+            return str(value)
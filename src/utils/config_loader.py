@@ -6,11 +6,68 @@ Supports .env files for sensitive credentials and secrets.
 """
 
 import os
+import copy
+import json
+import sys
 import yaml
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 from dotenv import load_dotenv
 
+# Parsed YAML keyed on (resolved path, mtime) so repeated loaders in one
+# process skip re-parsing an unchanged file
+_YAML_CACHE: Dict[Tuple[str, int], Dict[str, Any]] = {}
+
+# libyaml's C loader when PyYAML was built with it; same safe semantics
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Suffix appended to the config file name for the on-disk parse cache
+DISK_CACHE_SUFFIX = '.cache.json'
+
+# .env file found for each working directory (None if there is none), so
+# repeated loaders skip the directory walk
+_ENV_FILE_CACHE: Dict[Path, Optional[Path]] = {}
+
+
+def _find_env_file(start_dir: Path) -> Optional[Path]:
+    """Return the nearest .env at or above start_dir, or None."""
+    if start_dir in _ENV_FILE_CACHE:
+        return _ENV_FILE_CACHE[start_dir]
+
+    env_file: Optional[Path] = None
+    directory = start_dir
+
+    while True:
+        candidate = directory / '.env'
+        if candidate.exists():
+            env_file = candidate
+            break
+        if directory.parent == directory:
+            break
+        directory = directory.parent
+
+    _ENV_FILE_CACHE[start_dir] = env_file
+    return env_file
+
+
+def _flatten_into(flat: Dict[str, Any], mapping: Dict[str, Any], prefix: str) -> None:
+    """
+    Record every value of a nested mapping under its dotted path.
+
+    Nested mappings are recorded themselves and then descended into, so
+    'email' and 'email.smtp_host' both resolve. Keys are interned, since
+    loaders built from the same file share the same key strings. Keys
+    that are not strings or contain a dot cannot be reached by splitting
+    a dotted path, so they and their children are left out.
+    """
+    for key, value in mapping.items():
+        if not isinstance(key, str) or '.' in key:
+            continue
+        path = sys.intern(prefix + key)
+        flat[path] = value
+        if isinstance(value, dict):
+            _flatten_into(flat, value, path + '.')
+
 
 class ConfigLoader:
     """
@@ -20,38 +77,50 @@ class ConfigLoader:
     environment variables. Secrets should be stored in .env file.
 
     Attributes:
-        config: Dictionary containing all configuration values
+        config: Dictionary containing all configuration values. Treat it
+            (and any mapping get() returns) as read-only: get() answers from
+            a key index built once when the loader is created, so later
+            changes to this dictionary are not seen by get(). Use as_dict()
+            for a copy that can be modified freely.
 
     Example:
         >>> config_loader = ConfigLoader('config/config.yaml')
         >>> smtp_host = config_loader.get('email.smtp_host')
     """
 
-    def __init__(self, config_path: Optional[str] = None, env_path: Optional[str] = None):
+    def __init__(
+        self,
+        config_path: Optional[str] = None,
+        env_path: Optional[str] = None,
+        disk_cache: bool = False
+    ):
         """
         Initialize the configuration loader.
 
         Args:
             config_path: Path to YAML configuration file
             env_path: Path to .env file (default: .env in project root)
+            disk_cache: Keep the parsed YAML as JSON next to the config
+                file (e.g. config.yaml.cache.json) and load it instead of
+                parsing while the config file is unchanged (default: False)
 
         Raises:
             FileNotFoundError: If config file doesn't exist
             yaml.YAMLError: If config file is invalid YAML
         """
         self.config: Dict[str, Any] = {}
+        self.disk_cache = disk_cache
+        # Every value reachable from the config, keyed on its dotted path
+        self._flat: Dict[str, Any] = {}
 
         # Load environment variables from .env file
         if env_path:
             load_dotenv(env_path)
         else:
             # Try to find .env in current directory or parent directories
-            current_dir = Path.cwd()
-            for parent in [current_dir] + list(current_dir.parents):
-                env_file = parent / '.env'
-                if env_file.exists():
-                    load_dotenv(env_file)
-                    break
+            env_file = _find_env_file(Path.cwd())
+            if env_file is not None:
+                load_dotenv(env_file)
 
         # Load YAML configuration
         if config_path:
@@ -60,6 +129,9 @@ class ConfigLoader:
         # Override with environment variables
         self._load_env_overrides()
 
+        # Index the final configuration for single-lookup get()
+        _flatten_into(self._flat, self.config, '')
+
     def _load_yaml_config(self, config_path: str) -> None:
         """Load configuration from YAML file."""
         config_file = Path(config_path)
@@ -67,8 +139,77 @@ class ConfigLoader:
         if not config_file.exists():
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-        with open(config_file, 'r', encoding='utf-8') as f:
-            self.config = yaml.safe_load(f) or {}
+        cache_key = (str(config_file.resolve()), config_file.stat().st_mtime_ns)
+
+        if cache_key not in _YAML_CACHE:
+            parsed = self._read_disk_cache(config_file) if self.disk_cache else None
+
+            if parsed is None:
+                # One read of the whole file; the loader then works on an
+                # in-memory buffer instead of pulling chunks from the stream
+                parsed = yaml.load(config_file.read_bytes(), Loader=_YAML_LOADER) or {}
+
+                if self.disk_cache:
+                    self._write_disk_cache(config_file, parsed)
+
+            _YAML_CACHE[cache_key] = parsed
+
+        # Environment overrides modify the config in place, so each loader
+        # gets its own copy of the cached parse result
+        self.config = copy.deepcopy(_YAML_CACHE[cache_key])
+
+    def _read_disk_cache(self, config_file: Path) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached parse of config_file if it is still current.
+
+        The cache records the config file's mtime and size; a mismatch or
+        an unreadable cache file means the YAML is parsed again.
+        """
+        cache_file = config_file.with_name(config_file.name + DISK_CACHE_SUFFIX)
+        stat = config_file.stat()
+
+        try:
+            cached = json.loads(cache_file.read_bytes())
+            mtime_ns, size, parsed = cached['mtime_ns'], cached['size'], cached['config']
+        except (OSError, ValueError, TypeError, KeyError):
+            return None
+
+        if (mtime_ns, size) != (stat.st_mtime_ns, stat.st_size) or not isinstance(parsed, dict):
+            return None
+
+        return parsed
+
+    def _write_disk_cache(self, config_file: Path, parsed: Dict[str, Any]) -> None:
+        """
+        Write the parsed config as JSON next to config_file.
+
+        Configs that JSON cannot reproduce exactly (dates, non-string keys,
+        tuples) are not cached, and write errors are ignored. The file is
+        readable by its owner only since the config may hold credentials.
+        """
+        try:
+            payload = json.dumps(parsed)
+        except (TypeError, ValueError):
+            return
+
+        if json.loads(payload) != parsed:
+            return
+
+        cache_file = config_file.with_name(config_file.name + DISK_CACHE_SUFFIX)
+        temp_file = cache_file.with_name(cache_file.name + f'.{os.getpid()}.tmp')
+        stat = config_file.stat()
+
+        try:
+            fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(
+                    f'{{"mtime_ns": {stat.st_mtime_ns}, "size": {stat.st_size}, '
+                    f'"config": {payload}}}'
+                )
+            # Atomic replace so concurrent runs never read a partial file
+            os.replace(temp_file, cache_file)
+        except OSError:
+            temp_file.unlink(missing_ok=True)
 
     def _load_env_overrides(self) -> None:
         """
@@ -78,22 +219,25 @@ class ConfigLoader:
         Example: REPORTPILOT_EMAIL_SMTP_HOST=smtp.gmail.com
         """
         prefix = 'REPORTPILOT_'
+        prefix_len = len(prefix)
 
-        for key, value in os.environ.items():
-            if key.startswith(prefix):
-                # Remove prefix and convert to nested dict structure
-                config_key = key[len(prefix):].lower()
-                parts = config_key.split('_')
+        # Remove prefix and convert to nested dict structure
+        env_items = [
+            (key[prefix_len:].lower(), value)
+            for key, value in os.environ.items()
+            if key.startswith(prefix)
+        ]
 
-                # Navigate/create nested dict structure
-                current = self.config
-                for part in parts[:-1]:
-                    if part not in current:
-                        current[part] = {}
-                    current = current[part]
+        for config_key, value in env_items:
+            parts = config_key.split('_')
 
-                # Set the value (convert to appropriate type)
-                current[parts[-1]] = self._convert_value(value)
+            # Navigate/create nested dict structure
+            current = self.config
+            for part in parts[:-1]:
+                current = current.setdefault(part, {})
+
+            # Set the value (convert to appropriate type)
+            current[parts[-1]] = self._convert_value(value)
 
     def _convert_value(self, value: str) -> Any:
         """Convert string value to appropriate type."""
@@ -128,16 +272,46 @@ class ConfigLoader:
         Example:
             >>> config.get('email.smtp_host', 'smtp.gmail.com')
         """
-        parts = key.split('.')
-        current = self.config
+        return self._flat.get(key, default)
+
+    def compile(self, key: str, default: Any = None) -> Callable[[], Any]:
+        """
+        Build a resolver for a configuration key that is read repeatedly.
+
+        The returned function behaves like get(key, default) and is bound
+        to the loader's key index, so callers skip the method lookup.
+
+        Args:
+            key: Configuration key in dot notation (e.g., 'email.smtp_host')
+            default: Default value if key not found
+
+        Returns:
+            Function taking no arguments that returns the value or default
+
+        Example:
+            >>> smtp_host = config.compile('email.smtp_host', 'smtp.gmail.com')
+            >>> smtp_host()
+        """
+        flat = self._flat
+
+        def _resolve() -> Any:
+            return flat.get(key, default)
 
-        for part in parts:
-            if isinstance(current, dict) and part in current:
-                current = current[part]
-            else:
-                return default
+        return _resolve
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Get the parsed configuration as a dictionary.
 
-        return current
+        The configuration is parsed once when the loader is created; this
+        returns a deep copy of the in-memory result without touching the
+        filesystem. Changing the copy does not affect get(), which reads
+        the index built at load time.
+
+        Returns:
+            Dictionary containing all configuration values
+        """
+        return copy.deepcopy(self.config)
 
     def get_required(self, key: str) -> Any:
         """
@@ -3,14 +3,45 @@ Logging utility for the activity reporting system.
 
 Provides centralized logging configuration with both file and console handlers.
 Logs are stored in the logs/ directory with automatic rotation.
+
+Handlers are attached to the top-level logger of each calling package (e.g.
+'src', or '__main__' for run.py); module loggers propagate to it. The root
+logger is never touched, so host applications and third-party loggers keep
+their own configuration. Every package logger feeds one shared queue, read
+by a single background listener that owns the console handler and, once
+configured, the log file, so records are written in the order they were
+logged.
 """
 
+import atexit
 import logging
+import queue
 import sys
+import threading
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Optional
 
+# Formatters are shared by all handlers
+DETAILED_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+CONSOLE_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(levelname)s - %(message)s',
+    datefmt='%H:%M:%S'
+)
+
+# Process-wide queue and background listener; the listener owns the real
+# output handlers
+_LOG_QUEUE: queue.Queue = queue.Queue(-1)
+_LISTENER: Optional[QueueListener] = None
+_LISTENER_LOCK = threading.Lock()
+
+# Package loggers that send their records through the shared queue
+_QUEUED_PACKAGES = set()
+
 
 def setup_logger(
     name: str,
@@ -22,6 +53,12 @@ def setup_logger(
     """
     Set up a logger with both file and console handlers.
 
+    Handlers live on the top-level logger of the name's package and are
+    created only once; a log_file given by any caller receives the records
+    of every configured package. Every call applies its level, and its
+    log_file if that file has no handler yet, so later calls can add a
+    log file or change the level of an already configured logger.
+
     Args:
         name: Logger name (typically __name__ of the calling module)
         log_file: Path to log file (default: logs/activity_reporter.log)
@@ -36,34 +73,74 @@ def setup_logger(
         >>> logger = setup_logger(__name__)
         >>> logger.info("Process started")
     """
-    # Create logger
+    package_name = name.split('.', 1)[0]
+    _configure_package_logger(package_name, level)
+
+    # File handler (if log_file specified)
+    if log_file:
+        _add_file_handler(package_name, log_file, level, max_bytes, backup_count)
+
+    # Create logger; records propagate to the package logger's handlers
     logger = logging.getLogger(name)
     logger.setLevel(level)
 
-    # Avoid duplicate handlers
-    if logger.handlers:
-        return logger
+    return logger
 
-    # Create formatters
-    detailed_formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
 
-    console_formatter = logging.Formatter(
-        '%(asctime)s - %(levelname)s - %(message)s',
-        datefmt='%H:%M:%S'
-    )
+def _configure_package_logger(package_name: str, level: int) -> None:
+    """
+    Route a package's top-level logger through the shared queue once.
 
-    # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(level)
-    console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
+    The first call starts the QueueListener thread with the console
+    handler; it is stopped at exit, which writes out any queued records.
+    Each package logger then gets a QueueHandler for the same queue.
+    """
+    global _LISTENER
 
-    # File handler (if log_file specified)
-    if log_file:
+    with _LISTENER_LOCK:
+        package_logger = logging.getLogger(package_name)
+
+        # Avoid duplicate handlers
+        if package_logger.handlers:
+            return
+
+        package_logger.setLevel(level)
+
+        if _LISTENER is None:
+            # Console handler
+            console_handler = logging.StreamHandler(sys.stdout)
+            console_handler.setLevel(level)
+            console_handler.setFormatter(CONSOLE_FORMATTER)
+
+            _LISTENER = QueueListener(_LOG_QUEUE, console_handler, respect_handler_level=True)
+            _LISTENER.start()
+            atexit.register(_LISTENER.stop)
+
+        package_logger.addHandler(QueueHandler(_LOG_QUEUE))
+        _QUEUED_PACKAGES.add(package_name)
+
+
+def _add_file_handler(
+    package_name: str,
+    log_file: str,
+    level: int,
+    max_bytes: int,
+    backup_count: int
+) -> None:
+    """Add a rotating file handler to the shared listener once per file."""
+    with _LISTENER_LOCK:
+        # A package logger configured outside setup_logger does not use the
+        # queue; its file handler is then attached to the logger directly
+        queued = package_name in _QUEUED_PACKAGES
+        package_logger = logging.getLogger(package_name)
+        handlers = _LISTENER.handlers if queued else package_logger.handlers
         log_path = Path(log_file)
+
+        for handler in handlers:
+            if isinstance(handler, RotatingFileHandler) and \
+               Path(handler.baseFilename) == log_path.resolve():
+                return
+
         log_path.parent.mkdir(parents=True, exist_ok=True)
 
         file_handler = RotatingFileHandler(
@@ -73,7 +150,10 @@ def setup_logger(
             encoding='utf-8'
         )
         file_handler.setLevel(level)
-        file_handler.setFormatter(detailed_formatter)
-        logger.addHandler(file_handler)
+        file_handler.setFormatter(DETAILED_FORMATTER)
 
-    return logger
+        if queued:
+            # The listener thread reads this tuple per record; replacing it is atomic
+            _LISTENER.handlers = (*_LISTENER.handlers, file_handler)
+        else:
+            package_logger.addHandler(file_handler)
@@ -0,0 +1 @@
+"""Tests for the activity reporting system."""
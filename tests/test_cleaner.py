@@ -0,0 +1,133 @@
+"""Tests for data cleaning."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.cleaning.cleaner import DataCleaner
+
+
+def _arrow_frame():
+    pytest.importorskip('pyarrow')
+    df = pd.DataFrame({
+        'name': ['  Alice ', 'Bob  ', None, '  Alice '],
+        'value': [1, None, 3, 1],
+    })
+    return df.convert_dtypes(dtype_backend='pyarrow')
+
+
+def test_arrow_strings_are_standardized():
+    """string[pyarrow] columns are trimmed like object columns."""
+    df = _arrow_frame()
+    assert str(df['name'].dtype) == 'string[pyarrow]'
+
+    result = DataCleaner().clean(df)
+
+    assert result['name'].iloc[:2].tolist() == ['Alice', 'Bob']
+    assert result['name'].isna().sum() == 1
+    assert len(result) == 3
+
+
+def test_arrow_strings_fill_zero():
+    """The 'zero' strategy fills typed string columns with '0'."""
+    result = DataCleaner().clean(_arrow_frame(), {'fill_missing': 'zero'})
+
+    assert result['name'].tolist() == ['Alice', 'Bob', '0']
+    assert result['value'].tolist() == [1, 0, 3]
+
+
+def test_arrow_string_rules_are_not_pushed_down():
+    """Rules on Arrow string columns run after stripping, as for object columns."""
+    df = _arrow_frame()
+    rules = [{'column': 'name', 'condition': '==', 'value': 'Alice'}]
+
+    pushed, kept = DataCleaner()._split_pushdown_rules(df, rules, {})
+    assert pushed == []
+    assert kept == rules
+
+    result = DataCleaner().clean(df, {
+        'pushdown_rules': True,
+        'custom_rules': rules,
+    })
+    assert result['name'].tolist() == ['Alice']
+
+
+def test_numeric_dates_keep_default_unit():
+    """Numeric date columns are parsed like pd.to_datetime's default."""
+    values = pd.Series([1_700_000_000_000_000_000, None, 0])
+    df = pd.DataFrame({'ts': values})
+
+    result = DataCleaner().clean(df, {'date_columns': ['ts'], 'drop_empty_rows': False})
+
+    expected = pd.to_datetime(values, errors='coerce')
+    pd.testing.assert_series_equal(result['ts'], expected, check_names=False)
+
+
+def _sequential_outliers(df, columns):
+    """The original per-column IQR filter."""
+    for col in columns:
+        q1 = df[col].quantile(0.25)
+        q3 = df[col].quantile(0.75)
+        iqr = q3 - q1
+        df = df[(df[col] >= q1 - 1.5 * iqr) & (df[col] <= q3 + 1.5 * iqr)]
+    return df
+
+
+@pytest.mark.parametrize('use_numba', [False, True])
+@pytest.mark.parametrize('seed', range(5))
+def test_outliers_match_sequential_filter(seed, use_numba):
+    """Bounds follow the surviving rows and missing values are dropped."""
+    if use_numba:
+        pytest.importorskip('numba')
+
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'a': rng.standard_cauchy(200),
+        'b': rng.integers(-50, 50, 200),
+        'c': rng.standard_t(2, 200),
+    })
+    df.loc[rng.random(200) < 0.1, 'a'] = np.nan
+
+    cleaner = DataCleaner()
+    cleaner.cleaning_stats = {'operations': []}
+    result = cleaner._remove_outliers(df, ['a', 'b', 'c'], use_numba=use_numba)
+
+    pd.testing.assert_frame_equal(result, _sequential_outliers(df, ['a', 'b', 'c']))
+
+
+@pytest.mark.parametrize('config', [
+    {'remove_outliers': True},
+    {
+        'remove_outliers': True,
+        'custom_rules': [
+            {'column': 'count', 'condition': '>', 'value': -20},
+            {'column': 'name', 'condition': 'in', 'value': ['x', 'z']},
+        ],
+    },
+    {
+        'date_columns': ['date'],
+        'fill_missing': 'drop',
+        'custom_rules': [{'column': 'score', 'condition': '<', 'value': 1}],
+    },
+    {'duplicate_subset': ['name'], 'fill_missing': 'mean'},
+])
+def test_polars_engine_matches_pandas(config):
+    """The lazy polars query returns the rows and values of the pandas steps."""
+    pytest.importorskip('polars')
+
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame({
+        'score': rng.standard_cauchy(300),
+        'count': rng.integers(-50, 50, 300),
+        'spread': rng.standard_t(2, 300),
+        'name': rng.choice([' x', 'y ', 'z', None], 300),
+        'date': rng.choice([f'2024-01-0{day}' for day in range(1, 8)], 300),
+    })
+    df.loc[rng.random(300) < 0.1, 'score'] = np.nan
+
+    eager = DataCleaner().clean(df, config)
+    lazy = DataCleaner().clean(df, {**config, 'engine': 'polars'})
+
+    pd.testing.assert_frame_equal(
+        lazy.reset_index(drop=True), eager.reset_index(drop=True), check_dtype=False
+    )
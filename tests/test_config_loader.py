@@ -0,0 +1,102 @@
+"""Tests for configuration loading."""
+
+import json
+import os
+import stat
+
+import pytest
+
+from src.utils import config_loader
+from src.utils.config_loader import ConfigLoader, DISK_CACHE_SUFFIX
+
+CONFIG_TEXT = """\
+data:
+  input_folder: data/input
+  file_patterns:
+    - '*.csv'
+email:
+  enabled: false
+  smtp_port: 587
+"""
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    """A config file with no .env lookup or in-process parse cache."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(config_loader, '_YAML_CACHE', {})
+    path = tmp_path / 'config.yaml'
+    path.write_text(CONFIG_TEXT)
+    return path
+
+
+def _cache_file(path):
+    return path.with_name(path.name + DISK_CACHE_SUFFIX)
+
+
+def test_disk_cache_round_trip(config_file, monkeypatch):
+    """A second loader reads the JSON cache and gets the same config."""
+    first = ConfigLoader(str(config_file), disk_cache=True)
+
+    cache_file = _cache_file(config_file)
+    assert stat.S_IMODE(os.stat(cache_file).st_mode) == 0o600
+    assert json.loads(cache_file.read_text())['config'] == first.as_dict()
+
+    monkeypatch.setattr(config_loader, '_YAML_CACHE', {})
+    monkeypatch.setattr(config_loader.yaml, 'load', pytest.fail)
+    second = ConfigLoader(str(config_file), disk_cache=True)
+
+    assert second.as_dict() == first.as_dict()
+
+
+def test_disk_cache_invalidated_by_change(config_file, monkeypatch):
+    """Editing the config file makes the cache stale."""
+    ConfigLoader(str(config_file), disk_cache=True)
+
+    monkeypatch.setattr(config_loader, '_YAML_CACHE', {})
+    config_file.write_text(CONFIG_TEXT.replace('587', '2525'))
+
+    assert ConfigLoader(str(config_file), disk_cache=True).get('email.smtp_port') == 2525
+
+
+def test_disk_cache_skips_values_json_cannot_hold(config_file):
+    """Configs with YAML-only types are parsed every time, not cached."""
+    config_file.write_text(CONFIG_TEXT + 'schedule:\n  start: 2024-01-01\n')
+
+    ConfigLoader(str(config_file), disk_cache=True)
+
+    assert not _cache_file(config_file).exists()
+
+
+def _walk(config, key, default=None):
+    """The original dotted-path lookup."""
+    current = config
+    for part in key.split('.'):
+        if isinstance(current, dict) and part in current:
+            current = current[part]
+        else:
+            return default
+    return current
+
+
+def test_get_matches_path_walk(config_file):
+    """get() resolves every key exactly as walking the nested dicts does."""
+    config_file.write_text(CONFIG_TEXT + (
+        'reports:\n'
+        '  excel: {enabled: true, sheets: [summary]}\n'
+        '  "pdf.title": Weekly\n'
+        '  1: numeric\n'
+        '"a.b": 1\n'
+        'a: {b: 2, c: null}\n'
+    ))
+    loader = ConfigLoader(str(config_file))
+
+    keys = [
+        'data', 'data.input_folder', 'data.file_patterns', 'email.smtp_port',
+        'reports.excel', 'reports.excel.enabled', 'reports.excel.sheets',
+        'reports.pdf.title', 'reports.pdf', 'reports.1', 'a.b', 'a.c', 'a.d',
+        'email.smtp_port.x', 'missing', '',
+    ]
+    for key in keys:
+        assert loader.get(key, 'default') == _walk(loader.config, key, 'default'), key
+        assert loader.compile(key, 'default')() == loader.get(key, 'default'), key
@@ -0,0 +1,96 @@
+"""Tests for the SMTP email sender."""
+
+import smtplib
+
+import pytest
+
+from src.notification import email_sender
+from src.notification.email_sender import EmailSender
+
+CONFIG = {
+    'smtp_host': 'smtp.example.com',
+    'smtp_port': 587,
+    'from_email': 'reports@example.com',
+    'password': 'secret',
+}
+
+
+class FakeSMTP:
+    """Records the calls EmailSender makes; can drop the connection on send."""
+
+    instances = []
+    # Number of sends to fail across all connections, counted down
+    disconnects = 0
+
+    def __init__(self, host, port):
+        self.address = (host, port)
+        self.calls = []
+        self.sent = []
+        self.closed = False
+        FakeSMTP.instances.append(self)
+
+    def starttls(self):
+        self.calls.append('starttls')
+
+    def login(self, username, password):
+        self.calls.append(('login', username, password))
+
+    def send_message(self, msg, to_addrs):
+        if FakeSMTP.disconnects:
+            FakeSMTP.disconnects -= 1
+            raise smtplib.SMTPServerDisconnected('Connection unexpectedly closed')
+        self.sent.append((msg['Subject'], list(to_addrs)))
+
+    def quit(self):
+        self.closed = True
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_smtp(monkeypatch):
+    FakeSMTP.instances = []
+    FakeSMTP.disconnects = 0
+    monkeypatch.setattr(email_sender.smtplib, 'SMTP', FakeSMTP)
+    return FakeSMTP
+
+
+def test_messages_share_one_connection(fake_smtp):
+    """Consecutive sends log in once and reach every recipient."""
+    with EmailSender(CONFIG) as sender:
+        assert sender.send_report(['a@example.com'], 'First', 'body', cc=['c@example.com'])
+        assert sender.send_report(['a@example.com'], 'Second', 'body', bcc=['b@example.com'])
+
+    [server] = fake_smtp.instances
+    assert server.calls == ['starttls', ('login', 'reports@example.com', 'secret')]
+    assert server.sent == [
+        ('First', ['a@example.com', 'c@example.com']),
+        ('Second', ['a@example.com', 'b@example.com']),
+    ]
+    assert server.closed
+
+
+def test_dropped_connection_is_reopened(fake_smtp):
+    """A connection the server closed is replaced and the message still goes out."""
+    with EmailSender(CONFIG) as sender:
+        assert sender.send_report(['a@example.com'], 'First', 'body')
+        fake_smtp.disconnects = 1
+        assert sender.send_report(['a@example.com'], 'Second', 'body')
+
+    first, second = fake_smtp.instances
+    assert first.sent == [('First', ['a@example.com'])]
+    assert first.closed
+    assert second.calls == ['starttls', ('login', 'reports@example.com', 'secret')]
+    assert second.sent == [('Second', ['a@example.com'])]
+
+
+def test_second_disconnect_fails_the_send(fake_smtp):
+    """Reconnection is tried once; a second drop reports failure."""
+    fake_smtp.disconnects = 2
+
+    with EmailSender(CONFIG) as sender:
+        assert not sender.send_report(['a@example.com'], 'Report', 'body')
+
+    assert len(fake_smtp.instances) == 2
+    assert all(server.closed for server in fake_smtp.instances)
@@ -0,0 +1,149 @@
+"""Tests for the data readers."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+import pytest
+
+from src.ingestion.api_reader import APIReader
+from src.ingestion.csv_reader import CSVReader
+from src.ingestion.folder_reader import FolderReader
+
+CSV_TEXT = 'name,value,score\na,1,0.5\nb,,1.5\n,3,\n'
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / 'data.csv'
+    path.write_text(CSV_TEXT)
+    return path
+
+
+def test_csv_pyarrow_engine_matches_default_parser(csv_file):
+    """The Arrow parser returns the same values as the C parser."""
+    pytest.importorskip('pyarrow')
+
+    default = CSVReader({'path': str(csv_file)}).read()
+    arrow = CSVReader({'path': str(csv_file), 'engine': 'pyarrow'}).read()
+
+    # Arrow reports missing text as None rather than NaN
+    pd.testing.assert_frame_equal(arrow.fillna(pd.NA), default.fillna(pd.NA))
+
+
+def test_csv_pyarrow_engine_falls_back(csv_file, monkeypatch):
+    """Options the Arrow parser rejects fall back to the default parser."""
+    # The Arrow parser only accepts a row count for skiprows
+    config = {'path': str(csv_file), 'skip_rows': [2]}
+
+    default = CSVReader(config).read()
+    arrow = CSVReader({**config, 'engine': 'pyarrow'}).read()
+    pd.testing.assert_frame_equal(arrow, default)
+
+    # Without pyarrow the engine option is ignored
+    real_read_csv = pd.read_csv
+
+    def read_csv(*args, **kwargs):
+        if kwargs.get('engine') == 'pyarrow':
+            raise ImportError('pyarrow is not installed')
+        return real_read_csv(*args, **kwargs)
+
+    monkeypatch.setattr(pd, 'read_csv', read_csv)
+    result = CSVReader({'path': str(csv_file), 'engine': 'pyarrow'}).read()
+    pd.testing.assert_frame_equal(result, real_read_csv(csv_file))
+
+
+def test_folder_arrow_scan_matches_per_file_reads(tmp_path):
+    """One Arrow dataset scan combines files like concatenating per-file reads."""
+    pytest.importorskip('pyarrow')
+
+    (tmp_path / 'a.csv').write_text('name,value\na,1\n,2\n')
+    (tmp_path / 'b.csv').write_text('name,value,extra\nc,2.5,x\n')
+    (tmp_path / 'c.csv').write_text('value,name\n,d\n')
+
+    per_file = FolderReader({'path': str(tmp_path)}).read()
+    arrow = FolderReader({'path': str(tmp_path), 'engine': 'pyarrow'}).read()
+
+    assert list(arrow.columns) == list(per_file.columns)
+    pd.testing.assert_frame_equal(arrow.fillna(pd.NA), per_file.fillna(pd.NA))
+
+
+class PagedAPI(BaseHTTPRequestHandler):
+    """Serves ten records in pages of three for each pagination style."""
+
+    records = [{'id': i, 'value': i * 1.5} for i in range(10)]
+    page_size = 3
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        pages = len(self.records) // self.page_size + 1
+
+        if url.path == '/cursor':
+            start = int(query.get('cursor', 0))
+            end = start + self.page_size
+            body = {
+                'data': {'items': self.records[start:end]},
+                'next': str(end) if end < len(self.records) else None,
+            }
+        elif url.path == '/next':
+            start = int(query.get('offset', 0))
+            end = start + self.page_size
+            next_url = f'http://{self.headers["Host"]}/next?offset={end}'
+            body = {
+                'data': {'items': self.records[start:end]},
+                'next': next_url if end < len(self.records) else None,
+            }
+        else:
+            page = int(query.get('page', 1))
+            start = (page - 1) * self.page_size
+            body = {
+                'data': {'items': self.records[start:start + self.page_size]},
+                'pages': pages,
+            }
+
+        content = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope='module')
+def api_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), PagedAPI)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_port}'
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize('path, pagination', [
+    ('/cursor', {'type': 'cursor', 'cursor_path': 'next'}),
+    ('/next', {'type': 'next_url', 'next_path': 'next'}),
+    ('/page', {'type': 'page'}),
+    ('/page', {'type': 'page', 'total_pages_path': 'pages', 'concurrency': 3}),
+])
+def test_api_pagination_collects_every_page_in_order(api_url, path, pagination):
+    """Paged responses combine into the frame a single response would give."""
+    reader = APIReader({
+        'url': api_url + path,
+        'data_path': 'data.items',
+        'pagination': pagination,
+    })
+
+    pd.testing.assert_frame_equal(reader.read(), pd.DataFrame(PagedAPI.records))
+
+
+def test_api_without_pagination_reads_one_page(api_url):
+    """Without pagination only the first response is read, as before."""
+    reader = APIReader({'url': api_url + '/page', 'data_path': 'data.items'})
+
+    pd.testing.assert_frame_equal(reader.read(), pd.DataFrame(PagedAPI.records[:3]))
@@ -0,0 +1,29 @@
+"""Tests for weekly summarization."""
+
+import pandas as pd
+import pytest
+
+from src.aggregation.summarizer import DataSummarizer
+
+
+@pytest.mark.parametrize('start, end', [
+    # ISO week 1 of 2025 starts on Monday 2024-12-30
+    ('2024-12-20', '2025-01-12'),
+    # 2020 has an ISO week 53 that ends on Sunday 2021-01-03
+    ('2020-12-21', '2021-01-10'),
+])
+def test_week_start_matches_period_start(start, end):
+    """week_start equals the Monday from to_period('W').start_time."""
+    days = pd.date_range(start, end, freq='D')
+    # Times of day must not leak into the week start
+    hours = pd.to_timedelta([(i * 7) % 24 for i in range(len(days))], unit='h')
+    dates = pd.Series(days + hours, name='date')
+    df = pd.DataFrame({'date': dates, 'value': range(len(dates))})
+
+    result = DataSummarizer()._add_time_dimensions(df, 'date')
+
+    expected = dates.dt.to_period('W').dt.start_time
+    pd.testing.assert_series_equal(
+        result['week_start'], expected, check_names=False, check_freq=False
+    )
+    assert (result['week_start'].dt.weekday == 0).all()